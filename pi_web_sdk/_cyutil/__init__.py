@@ -0,0 +1,5 @@
+"""Optional compiled speedups for the PI Web API SDK.
+
+Modules in this package are Cython extensions. Every caller keeps a
+pure-Python fallback, so the SDK works unchanged when they are not built.
+"""
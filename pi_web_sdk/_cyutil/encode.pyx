@@ -0,0 +1,55 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""Cython implementation of the URL path encoder used by BaseController."""
+
+from cpython.bytearray cimport PyByteArray_AS_STRING
+from cpython.bytes cimport PyBytes_AS_STRING, PyBytes_GET_SIZE
+from cpython.unicode cimport PyUnicode_AsUTF8String, PyUnicode_DecodeASCII
+
+# Each byte maps to either its literal character or a "%XX" triplet
+cdef char TABLE[256][4]
+cdef unsigned char TABLE_LEN[256]
+
+
+cdef void _init_table():
+    cdef const char* hex_digits = b"0123456789ABCDEF"
+    cdef bytes unreserved = (
+        b"ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-._~"
+    )
+    cdef int b
+    for b in range(256):
+        if b in unreserved:
+            TABLE[b][0] = <char>b
+            TABLE_LEN[b] = 1
+        else:
+            TABLE[b][0] = b'%'
+            TABLE[b][1] = hex_digits[b >> 4]
+            TABLE[b][2] = hex_digits[b & 0x0F]
+            TABLE_LEN[b] = 3
+
+
+_init_table()
+
+
+cpdef str encode_path(str path):
+    """URL encode a path parameter, escaping everything but RFC 3986 unreserved chars."""
+    cdef bytes raw = PyUnicode_AsUTF8String(path)
+    cdef const unsigned char* src = <const unsigned char*>PyBytes_AS_STRING(raw)
+    cdef Py_ssize_t n = PyBytes_GET_SIZE(raw)
+    cdef bytearray out = bytearray(3 * n)
+    cdef char* dst = PyByteArray_AS_STRING(out)
+    cdef Py_ssize_t i
+    cdef Py_ssize_t j = 0
+    cdef unsigned char c
+
+    for i in range(n):
+        c = src[i]
+        if TABLE_LEN[c] == 1:
+            dst[j] = TABLE[c][0]
+            j += 1
+        else:
+            dst[j] = TABLE[c][0]
+            dst[j + 1] = TABLE[c][1]
+            dst[j + 2] = TABLE[c][2]
+            j += 3
+
+    return PyUnicode_DecodeASCII(dst, j, NULL)
@@ -0,0 +1,106 @@
+"""JSON encoding helpers with an optional orjson backend."""
+
+from __future__ import annotations
+
+import json
+from datetime import datetime
+from typing import Any, Iterator, Union
+
+try:
+    import orjson
+except ImportError:  # orjson not installed; use the standard library
+    orjson = None
+
+_ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_UTC_Z if orjson is not None else 0
+
+__all__ = ['dumps', 'iter_dumps', 'loads']
+
+
+def _default(obj: Any) -> Any:
+    """Encode values neither backend serializes natively.
+
+    Handles datetimes and NumPy values for json.dumps, and NumPy structured
+    arrays (one JSON object per record) for both backends.
+    """
+    if isinstance(obj, datetime):
+        time_str = obj.isoformat()
+        return time_str[:-6] + "Z" if time_str.endswith("+00:00") else time_str
+    names = getattr(getattr(obj, "dtype", None), "names", None)
+    if names:  # NumPy structured array or record
+        if obj.ndim == 0:
+            return dict(zip(names, obj.tolist()))
+        return [dict(zip(names, row)) for row in obj.tolist()]
+    if hasattr(obj, "tolist"):  # NumPy arrays and scalars
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize obj to compact UTF-8 JSON bytes.
+
+    Uses orjson (with NumPy support) when available, otherwise json.dumps.
+    Both backends accept datetime values and NumPy arrays/scalars; UTC
+    datetimes are written with a 'Z' suffix. Structured arrays become a list
+    of objects keyed by field name.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=_ORJSON_OPTIONS, default=_default)
+    return json.dumps(
+        obj, separators=(",", ":"), ensure_ascii=False, default=_default
+    ).encode("utf-8")
+
+
+def _is_long(obj: Any, chunk_size: int) -> bool:
+    """Return whether obj is a list or 1-D array longer than chunk_size."""
+    if isinstance(obj, (list, tuple)):
+        return len(obj) > chunk_size
+    return getattr(obj, "ndim", None) == 1 and len(obj) > chunk_size
+
+
+def _has_long_value(obj: Any, chunk_size: int) -> bool:
+    """Return whether obj is a dict holding a long list or array."""
+    return isinstance(obj, dict) and any(_is_long(v, chunk_size) for v in obj.values())
+
+
+def iter_dumps(obj: Any, chunk_size: int = 256) -> Iterator[bytes]:
+    """Serialize obj like dumps(), yielding the JSON in pieces.
+
+    Lists and 1-D arrays longer than chunk_size are encoded chunk_size
+    elements at a time, whether they are obj itself, values of a dict, or
+    values of dicts in a list (e.g. the ``values`` of OMF data messages).
+    Everything else is encoded whole. Joining the pieces gives the same
+    bytes as dumps(obj).
+    """
+    if _has_long_value(obj, chunk_size):
+        separator = b"{"
+        for key, value in obj.items():
+            yield separator + dumps(key) + b":"
+            yield from iter_dumps(value, chunk_size)
+            separator = b","
+        yield b"}"
+    elif _is_long(obj, chunk_size):
+        separator = b"["
+        for start in range(0, len(obj), chunk_size):
+            yield separator + dumps(obj[start:start + chunk_size])[1:-1]
+            separator = b","
+        yield b"]"
+    elif isinstance(obj, (list, tuple)) and any(_has_long_value(item, chunk_size) for item in obj):
+        separator = b"["
+        for item in obj:
+            yield separator
+            yield from iter_dumps(item, chunk_size)
+            separator = b","
+        yield b"]"
+    else:
+        yield dumps(obj)
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Deserialize JSON from bytes or str.
+
+    Uses orjson when available, otherwise json.loads. Both raise a
+    ValueError subclass on malformed input.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
-from typing import Dict, Optional
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, Iterable, Optional, Tuple, Union
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from .config import AuthMethod, PIWebAPIConfig
 from .controllers import (
@@ -50,16 +52,69 @@ from .controllers import (
     UnitController,
     UnitClassController,
 )
+from ._json import loads
+from .controllers.base import _encode_path_impl
 from .exceptions import PIWebAPIError
 
+if TYPE_CHECKING:
+    import httpx
+
 __all__ = ['PIWebAPIClient']
 
+_JSON_HEADERS = {"Content-Type": "application/json"}
+_UTF8_BOM = b"\xef\xbb\xbf"
+
+
+def _loads_body(content: bytes) -> Any:
+    """Decode a JSON response body, ignoring a leading UTF-8 BOM.
+
+    IIS-hosted PI Web API responses may start with a BOM, which orjson
+    rejects (requests' response.json() tolerated it).
+    """
+    if content.startswith(_UTF8_BOM):
+        content = content[3:]
+    return loads(content)
+
+
+def _encode_query(params: Dict[str, Any]) -> str:
+    """URL-encode query parameters into a query string.
+
+    Follows requests' conventions (None values are dropped, any iterable
+    value other than str/bytes repeats the key per element) but escapes
+    values with the compiled path encoder, so requests skips its urlencode
+    pass.
+    """
+    parts = []
+    append = parts.append
+    for key, value in params.items():
+        if value is None:
+            continue
+        if type(value) is str:
+            append(f"{key}={_encode_path_impl(value)}")
+            continue
+        if isinstance(value, (str, bytes)) or not hasattr(value, "__iter__"):
+            value = (value,)
+        for item in value:
+            if item is None:
+                continue
+            if isinstance(item, bytes):
+                item = item.decode("utf-8")
+            append(f"{key}={_encode_path_impl(str(item))}")
+    return "&".join(parts)
+
+
+async def _aiter_chunks(chunks: Iterable[bytes]) -> AsyncIterator[bytes]:
+    """Adapt a sync chunk iterator for httpx.AsyncClient request bodies."""
+    for chunk in chunks:
+        yield chunk
+
 class PIWebAPIClient:
     """Main PI Web API client."""
 
     def __init__(self, config: PIWebAPIConfig):
         self.config = config
         self.session = requests.Session()
+        self._setup_connection_pool()
         self._setup_authentication()
 
         # Initialize controller instances
@@ -107,6 +162,22 @@ class PIWebAPIClient:
         self.unit_class = UnitClassController(self)
         self.metrics = MetricsController(self)
 
+    def _setup_connection_pool(self):
+        """Mount pooled, retrying adapters so connections are kept alive and reused."""
+        adapter = HTTPAdapter(
+            pool_connections=self.config.pool_maxsize,
+            pool_maxsize=self.config.pool_maxsize,
+            max_retries=Retry(
+                total=self.config.max_retries,
+                backoff_factor=0.1,
+                status_forcelist=(502, 503, 504),
+                # Return the last response so errors still surface as PIWebAPIError
+                raise_on_status=False,
+            ),
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
     def _setup_authentication(self):
         """Setup authentication for the session."""
         if self.config.auth_method == AuthMethod.BASIC:
@@ -130,23 +201,76 @@ class PIWebAPIClient:
             # No authentication setup needed for anonymous access
             pass
 
+    def _prepare_request(self, endpoint: str, params: Optional[Dict]) -> Tuple[str, str]:
+        """Build the request URL and the encoded query string.
+
+        The default webIdType parameter is appended unless params sets one.
+        """
+        url = f"{self.config.base_url.rstrip('/')}/{endpoint.lstrip('/')}"
+
+        if not params:
+            return url, f"webIdType={self.config.webid_type.value}"
+        query = _encode_query(params)
+        if "webIdType" not in params:
+            web_id_type = f"webIdType={self.config.webid_type.value}"
+            query = f"{query}&{web_id_type}" if query else web_id_type
+        return url, query
+
+    @staticmethod
+    def _parse_response(response) -> Dict:
+        """Raise PIWebAPIError for HTTP errors, otherwise decode the body.
+
+        Works with both requests and httpx responses.
+        """
+        # Check for HTTP errors
+        if response.status_code >= 400:
+            try:
+                error_data = _loads_body(response.content)
+                error_message = (
+                    error_data.get("Errors", [response.text])[0]
+                    if error_data.get("Errors")
+                    else response.text
+                )
+            except:
+                error_message = response.text
+            raise PIWebAPIError(
+                error_message,
+                response.status_code,
+                error_data if "error_data" in locals() else None,
+            )
+
+        # Parse JSON response from the raw bytes (orjson when installed)
+        try:
+            return _loads_body(response.content)
+        except ValueError:
+            # For POST/PATCH/DELETE, check Location header for WebId
+            result = {"content": response.text}
+            if "Location" in response.headers:
+                result["Location"] = response.headers["Location"]
+                # Extract WebId from Location header
+                location = response.headers["Location"]
+                # WebId can be in query param (webid=...) or path (/resource/WEBID)
+                if "webid=" in location.lower():
+                    web_id = location.split("webid=")[-1].split("&")[0]
+                    result["WebId"] = web_id
+                else:
+                    # Extract from URL path (last segment after last /)
+                    path_parts = location.rstrip("/").split("/")
+                    if path_parts:
+                        result["WebId"] = path_parts[-1]
+            return result
+
     def _make_request(
         self,
         method: str,
         endpoint: str,
         params: Optional[Dict] = None,
-        data: Optional[Dict] = None,
+        data: Optional[Union[Dict, bytes, Iterable[bytes]]] = None,
         json_data: Optional[Dict] = None,
         headers: Optional[Dict] = None,
     ) -> Dict:
         """Make HTTP request to PI Web API."""
-        url = f"{self.config.base_url.rstrip('/')}/{endpoint.lstrip('/')}"
-
-        # Add webIdType to params if not already specified
-        if params is None:
-            params = {}
-        if "webIdType" not in params:
-            params["webIdType"] = self.config.webid_type.value
+        url, params = self._prepare_request(endpoint, params)
 
         # Prepare headers
         request_headers = self.session.headers.copy()
@@ -164,47 +288,78 @@ class PIWebAPIClient:
                 verify=self.config.verify_ssl,
                 timeout=self.config.timeout,
             )
+        except requests.RequestException as e:
+            raise PIWebAPIError(f"Request failed: {str(e)}")
+        return self._parse_response(response)
 
-            # Check for HTTP errors
-            if response.status_code >= 400:
-                try:
-                    error_data = response.json()
-                    error_message = (
-                        error_data.get("Errors", [response.text])[0]
-                        if error_data.get("Errors")
-                        else response.text
-                    )
-                except:
-                    error_message = response.text
-                raise PIWebAPIError(
-                    error_message,
-                    response.status_code,
-                    error_data if "error_data" in locals() else None,
-                )
+    def async_session(self) -> "httpx.AsyncClient":
+        """Create an HTTP/2 ``httpx.AsyncClient`` configured like ``session``.
 
-            # Parse JSON response
-            try:
-                return response.json()
-            except ValueError:
-                # For POST/PATCH/DELETE, check Location header for WebId
-                result = {"content": response.text}
-                if "Location" in response.headers:
-                    result["Location"] = response.headers["Location"]
-                    # Extract WebId from Location header
-                    location = response.headers["Location"]
-                    # WebId can be in query param (webid=...) or path (/resource/WEBID)
-                    if "webid=" in location.lower():
-                        web_id = location.split("webid=")[-1].split("&")[0]
-                        result["WebId"] = web_id
-                    else:
-                        # Extract from URL path (last segment after last /)
-                        path_parts = location.rstrip("/").split("/")
-                        if path_parts:
-                            result["WebId"] = path_parts[-1]
-                return result
+        Concurrent requests made through one async session are multiplexed
+        over a single connection. Use it as an async context manager and pass
+        it to get_async(). Requires the optional ``httpx[http2]`` dependency.
+        """
+        try:
+            import httpx
+        except ImportError as e:
+            raise PIWebAPIError(
+                "Async requests require httpx: pip install 'pi-web-sdk[http2]'"
+            ) from e
+        return httpx.AsyncClient(
+            http2=True,
+            auth=self.session.auth,
+            headers=dict(self.session.headers),
+            verify=self.config.verify_ssl,
+            timeout=self.config.timeout,
+        )
 
-        except requests.RequestException as e:
+    async def get_async(
+        self,
+        session: "httpx.AsyncClient",
+        endpoint: str,
+        params: Optional[Dict] = None,
+    ) -> Dict:
+        """Make GET request on a session created by async_session()."""
+        import httpx
+
+        url, params = self._prepare_request(endpoint, params)
+        try:
+            response = await session.get(url, params=params)
+        except httpx.HTTPError as e:
+            raise PIWebAPIError(f"Request failed: {str(e)}")
+        return self._parse_response(response)
+
+    async def post_async(
+        self,
+        session: "httpx.AsyncClient",
+        endpoint: str,
+        data: Optional[Dict] = None,
+        params: Optional[Dict] = None,
+        headers: Optional[Dict] = None,
+        body: Optional[Union[bytes, Iterable[bytes]]] = None,
+    ) -> Dict:
+        """Make POST request on a session created by async_session().
+
+        ``body`` is a pre-serialized JSON payload sent as-is instead of ``data``;
+        an iterable of chunks is streamed with chunked transfer encoding.
+        """
+        import httpx
+
+        url, params = self._prepare_request(endpoint, params)
+        post_headers = {"X-Requested-With": "XMLHttpRequest"}
+        if body is not None:
+            post_headers.update(_JSON_HEADERS)
+        if headers:
+            post_headers.update(headers)
+        try:
+            if body is not None:
+                content = body if isinstance(body, bytes) else _aiter_chunks(body)
+                response = await session.post(url, params=params, content=content, headers=post_headers)
+            else:
+                response = await session.post(url, params=params, json=data, headers=post_headers)
+        except httpx.HTTPError as e:
             raise PIWebAPIError(f"Request failed: {str(e)}")
+        return self._parse_response(response)
 
     def get(self, endpoint: str, params: Optional[Dict] = None) -> Dict:
         """Make GET request."""
@@ -215,20 +370,38 @@ class PIWebAPIClient:
         endpoint: str, 
         data: Optional[Dict] = None, 
         params: Optional[Dict] = None,
-        headers: Optional[Dict] = None
+        headers: Optional[Dict] = None,
+        body: Optional[Union[bytes, Iterable[bytes]]] = None,
     ) -> Dict:
-        """Make POST request."""
+        """Make POST request.
+
+        ``body`` is a pre-serialized JSON payload sent as-is instead of ``data``;
+        an iterable of chunks is streamed with chunked transfer encoding.
+        """
         # Add X-Requested-With header for POST requests
         post_headers = {"X-Requested-With": "XMLHttpRequest"}
+        if body is not None:
+            post_headers.update(_JSON_HEADERS)
         if headers:
             post_headers.update(headers)
-            
+
+        if body is not None:
+            return self._make_request("POST", endpoint, params=params, data=body, headers=post_headers)
         return self._make_request("POST", endpoint, params=params, json_data=data, headers=post_headers)
 
     def put(
-        self, endpoint: str, data: Optional[Dict] = None, params: Optional[Dict] = None
+        self,
+        endpoint: str,
+        data: Optional[Dict] = None,
+        params: Optional[Dict] = None,
+        body: Optional[bytes] = None,
     ) -> Dict:
-        """Make PUT request."""
+        """Make PUT request.
+
+        ``body`` is a pre-serialized JSON payload sent as-is instead of ``data``.
+        """
+        if body is not None:
+            return self._make_request("PUT", endpoint, params=params, data=body, headers=_JSON_HEADERS)
         return self._make_request("PUT", endpoint, params=params, json_data=data)
 
     def patch(
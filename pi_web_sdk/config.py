@@ -40,3 +40,5 @@ class PIWebAPIConfig:
     verify_ssl: bool = True
     timeout: int = 30
     webid_type: WebIDType = WebIDType.FULL
+    pool_maxsize: int = 32
+    max_retries: int = 3
@@ -54,6 +54,7 @@ from .stream import (
     StreamSetController,
     BufferOption,
     UpdateOption,
+    encode_stream_values,
 )
 
 from .table import TableController, TableCategoryController
@@ -114,6 +115,7 @@ __all__ = [
     'StreamSetController',
     'BufferOption',
     'UpdateOption',
+    'encode_stream_values',
     'TableController',
     'TableCategoryController',
     'OmfController',
@@ -5,7 +5,7 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Dict, Optional, Union
 
-from .base import BaseController
+from .base import BaseController, _format_time
 from ..models.asset import AssetServer, AssetDatabase, Element, ElementCategory, ElementTemplate
 
 __all__ = [
@@ -485,7 +485,7 @@ class ElementController(BaseController):
             params["canBeAcknowledged"] = can_be_acknowledged
         if category_name:
             params["categoryName"] = category_name
-        end_time_str = self._format_time(end_time)
+        end_time_str = _format_time(end_time)
         if end_time_str:
             params["endTime"] = end_time_str
         if is_acknowledged is not None:
@@ -502,7 +502,7 @@ class ElementController(BaseController):
             params["sortField"] = sort_field
         if sort_order:
             params["sortOrder"] = sort_order
-        start_time_str = self._format_time(start_time)
+        start_time_str = _format_time(start_time)
         if start_time_str:
             params["startTime"] = start_time_str
         if template_name:
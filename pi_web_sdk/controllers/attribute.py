@@ -5,7 +5,7 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Dict, Optional, Union
 
-from .base import BaseController
+from .base import BaseController, _format_time
 from ..models.attribute import Attribute, AttributeCategory, AttributeTemplate
 
 __all__ = [
@@ -61,7 +61,7 @@ class AttributeController(BaseController):
         params = {}
         if selected_fields:
             params["selectedFields"] = selected_fields
-        time_str = self._format_time(time)
+        time_str = _format_time(time)
         if time_str:
             params["time"] = time_str
         if desired_units:
@@ -3,11 +3,122 @@
 from __future__ import annotations
 
 import urllib.parse
-from datetime import datetime
-from typing import Optional, Union
+from datetime import datetime, timezone
+from typing import Callable, Dict, Optional, Sequence, Tuple, Union
+
+try:
+    from .._cyutil.encode import encode_path as _cy_encode_path
+except ImportError:  # Extension not compiled; use the pure-Python encoder
+    _cy_encode_path = None
 
 __all__ = ['BaseController']
 
+
+def _py_encode_path(path: str) -> str:
+    """URL encode a path parameter using the standard library."""
+    return urllib.parse.quote(path, safe="")
+
+
+_encode_path_impl = _cy_encode_path or _py_encode_path
+
+_isoformat = datetime.isoformat
+
+# Zero-padded 2-digit strings used to format UTC timestamps without isoformat()
+_D2 = tuple(f"{i:02d}" for i in range(100))
+
+
+def _format_time(time_value: Union[str, datetime, None]) -> Optional[str]:
+    """Convert time value to PI Web API compatible string format.
+
+    Args:
+        time_value: Time as string, datetime object, or None
+
+    Returns:
+        Formatted time string or None if input is None
+
+    Notes:
+        - String values are returned as-is (allows special values like "*", "Today", etc.)
+        - datetime objects are converted to ISO 8601 format
+        - UTC timezone (+00:00) is converted to 'Z' suffix for PI Web API compatibility
+        - Timezone-naive datetimes are treated as local time
+    """
+    # Exact type checks first: pre-formatted strings are the common case
+    value_type = type(time_value)
+    if value_type is str:
+        return time_value
+    if value_type is datetime:
+        tzinfo = time_value.tzinfo
+        if tzinfo is None:
+            # Naive values never carry an offset; C isoformat() is fastest here
+            return _isoformat(time_value)
+        if tzinfo is timezone.utc and not time_value.microsecond:
+            # Whole-second UTC: assemble from precomputed 2-digit strings
+            year = time_value.year
+            return (
+                f"{_D2[year // 100]}{_D2[year % 100]}-{_D2[time_value.month]}-{_D2[time_value.day]}"
+                f"T{_D2[time_value.hour]}:{_D2[time_value.minute]}:{_D2[time_value.second]}Z"
+            )
+        time_str = _isoformat(time_value)
+    elif time_value is None:
+        return None
+    elif isinstance(time_value, str):
+        return time_value
+    elif isinstance(time_value, datetime):
+        # Use isoformat() which produces ISO 8601 compliant strings
+        # Format: YYYY-MM-DDTHH:MM:SS[.ffffff][+HH:MM]
+        time_str = time_value.isoformat()
+    else:
+        raise TypeError(f"Time value must be str, datetime, or None, got {type(time_value)}")
+    # Convert +00:00 to Z for better PI Web API compatibility
+    if time_str.endswith('+00:00'):
+        time_str = time_str[:-6] + 'Z'
+    return time_str
+
+
+def _make_param_builder(
+    spec: Sequence[Tuple[str, str, Optional[Callable]]],
+    required: Sequence[Tuple[str, str]] = (),
+) -> Callable[..., Dict]:
+    """Compile a query parameter builder from a declarative field spec.
+
+    The returned function takes the listed kwargs and returns the params dict.
+    Its body is generated once as straight-line code, so building params at
+    call time costs no loops or per-field dispatch.
+
+    Args:
+        spec: (kwarg, ParamName, formatter) tuples for optional parameters.
+            A parameter is included when its (formatted) value is truthy;
+            formatter may be None, otherwise it is applied to non-None values.
+        required: (kwarg, ParamName) tuples always included in the result
+
+    Returns:
+        Function building the params dict from keyword arguments
+    """
+    args = [kwarg for kwarg, _ in required] + [kwarg for kwarg, _, _ in spec]
+    for kwarg in args:
+        if not kwarg.isidentifier():
+            raise ValueError(f"Invalid parameter name: {kwarg!r}")
+
+    namespace: Dict[str, Callable] = {}
+    defaults = []
+    body = ["    p = {" + ", ".join(f"{name!r}: {kwarg}" for kwarg, name in required) + "}"]
+    for index, (kwarg, name, formatter) in enumerate(spec):
+        if formatter is None:
+            body.append(f"    if {kwarg}: p[{name!r}] = {kwarg}")
+            continue
+        helper = f"_f{index}"
+        namespace[helper] = formatter
+        defaults.append(f"{helper}={helper}")
+        body.append(f"    if {kwarg} is not None:")
+        body.append(f"        {kwarg} = {helper}({kwarg})")
+        body.append(f"        if {kwarg}: p[{name!r}] = {kwarg}")
+    body.append("    return p")
+
+    source = f"def build({', '.join(args + defaults)}):\n" + "\n".join(body) + "\n"
+    exec(compile(source, "<param_builder>", "exec"), namespace)
+    return namespace["build"]
+
+
 class BaseController:
     """Base controller class."""
 
@@ -16,33 +127,6 @@ class BaseController:
 
     def _encode_path(self, path: str) -> str:
         """URL encode a path parameter."""
-        return urllib.parse.quote(path, safe="")
-
-    def _format_time(self, time_value: Union[str, datetime, None]) -> Optional[str]:
-        """Convert time value to PI Web API compatible string format.
-
-        Args:
-            time_value: Time as string, datetime object, or None
-
-        Returns:
-            Formatted time string or None if input is None
-
-        Notes:
-            - String values are returned as-is (allows special values like "*", "Today", etc.)
-            - datetime objects are converted to ISO 8601 format
-            - UTC timezone (+00:00) is converted to 'Z' suffix for PI Web API compatibility
-            - Timezone-naive datetimes are treated as local time
-        """
-        if time_value is None:
-            return None
-        if isinstance(time_value, str):
-            return time_value
-        if isinstance(time_value, datetime):
-            # Use isoformat() which produces ISO 8601 compliant strings
-            # Format: YYYY-MM-DDTHH:MM:SS[.ffffff][+HH:MM]
-            time_str = time_value.isoformat()
-            # Convert +00:00 to Z for better PI Web API compatibility
-            if time_str.endswith('+00:00'):
-                time_str = time_str[:-6] + 'Z'
-            return time_str
-        raise TypeError(f"Time value must be str, datetime, or None, got {type(time_value)}")
+        return _encode_path_impl(path)
+
+    _format_time = staticmethod(_format_time)
@@ -5,7 +5,7 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Dict, List, Optional, Union
 
-from .base import BaseController
+from .base import BaseController, _format_time
 
 __all__ = [
     'BatchController',
@@ -16,16 +16,21 @@ __all__ = [
 class BatchController(BaseController):
     """Controller for Batch operations."""
 
-    def execute(self, requests: List[Dict]) -> Dict:
+    def execute(self, requests: Union[List[Dict], Dict[str, Dict]]) -> Dict:
         """Execute multiple API requests in a single batch call.
 
         Args:
-            requests: List of request dictionaries with keys:
+            requests: List of request dictionaries, or a dictionary of them
+                keyed by request ID so requests can depend on each other.
+                Each request has keys:
                 - Method: HTTP method (GET, POST, PUT, etc.)
                 - Resource: API endpoint path
                 - Parameters: Optional query parameters
                 - Content: Optional request body
                 - Headers: Optional additional headers
+                - ParentIds: Optional IDs of requests that must complete first;
+                  with ParentIds, Parameters holds JSONPath expressions (e.g.
+                  "$.create.Headers.Location") substituted into Resource as {0}, {1}, ...
         """
         return self.client.post("batch", data=requests)
 
@@ -43,8 +48,8 @@ class BatchController(BaseController):
         # First, get existing values in the time range
         existing_data = self.client.stream.get_recorded(
             web_id=point_webid,
-            start_time=self._format_time(start_time),
-            end_time=self._format_time(end_time),
+            start_time=_format_time(start_time),
+            end_time=_format_time(end_time),
             max_count=10_000,  # Adjust as needed
         )
 
@@ -5,7 +5,7 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Dict, Optional, Union
 
-from .base import BaseController
+from .base import BaseController, _format_time
 from ..models.event import EventFrame
 
 __all__ = [
@@ -91,10 +91,10 @@ class EventFrameController(BaseController):
             params['categoryName'] = category_name
         if template_name:
             params['templateName'] = template_name
-        start_time_str = self._format_time(start_time)
+        start_time_str = _format_time(start_time)
         if start_time_str:
             params['startTime'] = start_time_str
-        end_time_str = self._format_time(end_time)
+        end_time_str = _format_time(end_time)
         if end_time_str:
             params['endTime'] = end_time_str
         if sort_field:
@@ -270,7 +270,7 @@ class EventFrameController(BaseController):
             params['attributeNameFilter'] = attribute_name_filter
         if attribute_type:
             params['attributeType'] = attribute_type
-        end_time_str = self._format_time(end_time)
+        end_time_str = _format_time(end_time)
         if end_time_str:
             params['endTime'] = end_time_str
         if event_frame_category:
@@ -289,7 +289,7 @@ class EventFrameController(BaseController):
             params['sortField'] = sort_field
         if sort_order:
             params['sortOrder'] = sort_order
-        start_time_str = self._format_time(start_time)
+        start_time_str = _format_time(start_time)
         if start_time_str:
             params['startTime'] = start_time_str
         if selected_fields:
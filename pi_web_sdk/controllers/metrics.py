@@ -5,7 +5,7 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Dict, Optional, Union
 
-from .base import BaseController
+from .base import BaseController, _format_time
 
 __all__ = [
     'MetricsController',
@@ -31,10 +31,10 @@ class MetricsController(BaseController):
     ) -> Dict:
         """Get request metrics."""
         params = {}
-        start_time_str = self._format_time(start_time)
+        start_time_str = _format_time(start_time)
         if start_time_str:
             params["startTime"] = start_time_str
-        end_time_str = self._format_time(end_time)
+        end_time_str = _format_time(end_time)
         if end_time_str:
             params["endTime"] = end_time_str
         if interval:
@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import gzip
 import time
-from typing import TYPE_CHECKING, Dict, List, Optional, Any
+import zlib
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional, Any, Tuple, Union
 from datetime import datetime, timezone
 
+from .._json import dumps, iter_dumps
 from .base import BaseController
 from ..models.omf import (
     OMFType, OMFContainer, OMFAsset, OMFTimeSeriesData, OMFBatch,
@@ -15,6 +18,8 @@ from ..models.omf import (
 )
 
 if TYPE_CHECKING:
+    import httpx
+
     from ..client import PIWebAPIClient
 
 __all__ = [
@@ -23,6 +28,16 @@ __all__ = [
 ]
 
 
+def _gzip_chunks(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """Gzip a stream of byte chunks, yielding compressed output as it is produced."""
+    compressor = zlib.compressobj(1, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
 class OmfController(BaseController):
     """Controller for OMF operations."""
 
@@ -33,6 +48,8 @@ class OmfController(BaseController):
         omf_version: Optional[str] = None,
         action: Optional[str] = None,
         data_server_web_id: Optional[str] = None,
+        compression: Optional[str] = None,
+        chunk_size: Optional[int] = None,
     ) -> Dict:
         """Send OMF data asynchronously.
 
@@ -42,7 +59,53 @@ class OmfController(BaseController):
             omf_version: OMF version
             action: Action to perform (create, update, delete)
             data_server_web_id: WebID of the target data server
+            compression: Body compression; only "gzip" is supported
+            chunk_size: Stream the body with chunked transfer encoding,
+                serializing long value lists this many items at a time.
+                Streamed bodies cannot be replayed by connection retries.
         """
+        body, headers, params = self._encode_message(
+            data, message_type, omf_version, action, data_server_web_id, compression, chunk_size
+        )
+        return self.client.post("omf", body=body, headers=headers, params=params)
+
+    async def post_with_session(
+        self,
+        session: "httpx.AsyncClient",
+        data: Dict,
+        message_type: Optional[str] = None,
+        omf_version: Optional[str] = None,
+        action: Optional[str] = None,
+        data_server_web_id: Optional[str] = None,
+        compression: Optional[str] = None,
+        chunk_size: Optional[int] = None,
+    ) -> Dict:
+        """Send OMF data on an async session from client.async_session().
+
+        Lets many OMF messages be in flight at once; arguments are the same
+        as post_async().
+        """
+        body, headers, params = self._encode_message(
+            data, message_type, omf_version, action, data_server_web_id, compression, chunk_size
+        )
+        return await self.client.post_async(session, "omf", body=body, headers=headers, params=params)
+
+    @staticmethod
+    def _encode_message(
+        data: Dict,
+        message_type: Optional[str],
+        omf_version: Optional[str],
+        action: Optional[str],
+        data_server_web_id: Optional[str],
+        compression: Optional[str],
+        chunk_size: Optional[int] = None,
+    ) -> Tuple[Union[bytes, Iterator[bytes]], Dict[str, str], Dict[str, str]]:
+        """Build the OMF message body, headers and query parameters.
+
+        With chunk_size the body is a lazy iterator of (compressed) chunks.
+        """
+        body = iter_dumps(data, chunk_size) if chunk_size else dumps(data)
+
         headers = {}
         if message_type:
             headers["messagetype"] = message_type
@@ -50,28 +113,44 @@ class OmfController(BaseController):
             headers["omfversion"] = omf_version
         if action:
             headers["action"] = action
+        if compression:
+            if compression != "gzip":
+                raise ValueError(f"Unsupported OMF compression: {compression!r}")
+            # Level 1: OMF JSON is repetitive, so even the fastest level shrinks it several-fold
+            body = _gzip_chunks(body) if chunk_size else gzip.compress(body, compresslevel=1)
+            headers["compression"] = compression
 
         params = {}
         if data_server_web_id:
             params["dataServerWebId"] = data_server_web_id
-
-        return self.client.post("omf", data=data, headers=headers, params=params)
+        return body, headers, params
 
 
 class OMFManager:
     """High-level manager for OMF operations using dataclass models."""
 
-    def __init__(self, client: PIWebAPIClient, data_server_web_id: Optional[str] = None):
+    def __init__(
+        self,
+        client: PIWebAPIClient,
+        data_server_web_id: Optional[str] = None,
+        compression: Optional[str] = None,
+        chunk_size: Optional[int] = None,
+    ):
         """
         Initialize OMF Manager.
 
         Args:
             client: PI Web API client instance
             data_server_web_id: Optional specific data server WebID
+            compression: Set to "gzip" to compress every OMF message body
+            chunk_size: Stream message bodies, serializing long value lists
+                this many items at a time (see OmfController.post_async)
         """
         self.client = client
         self.data_server_web_id = data_server_web_id
         self.omf_version = "1.2"
+        self.compression = compression
+        self.chunk_size = chunk_size
 
         # Auto-detect data server if not provided
         if not self.data_server_web_id:
@@ -108,6 +187,8 @@ class OMFManager:
             data=[omf_type.to_dict()],
             message_type=OMFMessageType.TYPE.value,
             omf_version=self.omf_version,
+            compression=self.compression,
+            chunk_size=self.chunk_size,
             action=action.value,
             data_server_web_id=self.data_server_web_id
         )
@@ -134,6 +215,8 @@ class OMFManager:
             data=[container.to_dict()],
             message_type=OMFMessageType.CONTAINER.value,
             omf_version=self.omf_version,
+            compression=self.compression,
+            chunk_size=self.chunk_size,
             action=action.value,
             data_server_web_id=self.data_server_web_id
         )
@@ -160,6 +243,8 @@ class OMFManager:
             data=[asset.to_dict()],
             message_type=OMFMessageType.DATA.value,
             omf_version=self.omf_version,
+            compression=self.compression,
+            chunk_size=self.chunk_size,
             action=action.value,
             data_server_web_id=self.data_server_web_id
         )
@@ -186,6 +271,39 @@ class OMFManager:
             data=[ts_data.to_dict()],
             message_type=OMFMessageType.DATA.value,
             omf_version=self.omf_version,
+            compression=self.compression,
+            chunk_size=self.chunk_size,
+            action=action.value,
+            data_server_web_id=self.data_server_web_id
+        )
+
+    async def send_time_series_data_async(
+        self,
+        session: "httpx.AsyncClient",
+        ts_data: OMFTimeSeriesData,
+        action: OMFAction = OMFAction.CREATE
+    ) -> Dict[str, Any]:
+        """
+        Send time series data on an async session.
+
+        Args:
+            session: Session from client.async_session()
+            ts_data: OMF time series data dataclass instance
+            action: OMF action (create, update, delete)
+
+        Returns:
+            Response from PI Web API
+        """
+        if not self.data_server_web_id:
+            raise ValueError("No data server WebID available")
+
+        return await self.client.omf.post_with_session(
+            session,
+            data=[ts_data.to_dict()],
+            message_type=OMFMessageType.DATA.value,
+            omf_version=self.omf_version,
+            compression=self.compression,
+            chunk_size=self.chunk_size,
             action=action.value,
             data_server_web_id=self.data_server_web_id
         )
@@ -214,6 +332,8 @@ class OMFManager:
                 data=type_messages,
                 message_type=OMFMessageType.TYPE.value,
                 omf_version=self.omf_version,
+                compression=self.compression,
+                chunk_size=self.chunk_size,
                 action=action.value,
                 data_server_web_id=self.data_server_web_id
             )
@@ -225,6 +345,8 @@ class OMFManager:
                 data=container_messages,
                 message_type=OMFMessageType.CONTAINER.value,
                 omf_version=self.omf_version,
+                compression=self.compression,
+                chunk_size=self.chunk_size,
                 action=action.value,
                 data_server_web_id=self.data_server_web_id
             )
@@ -236,6 +358,8 @@ class OMFManager:
                 data=data_messages,
                 message_type=OMFMessageType.DATA.value,
                 omf_version=self.omf_version,
+                compression=self.compression,
+                chunk_size=self.chunk_size,
                 action=action.value,
                 data_server_web_id=self.data_server_web_id
             )
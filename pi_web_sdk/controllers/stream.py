@@ -2,17 +2,22 @@
 
 from __future__ import annotations
 
+import asyncio
+import os
 from datetime import datetime
 from enum import Enum
-from typing import Dict, List, Optional, Union
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Union
 
-from .base import BaseController
+from .._json import dumps
+from .base import BaseController, _format_time, _make_param_builder
 
 __all__ = [
     'StreamController',
     'StreamSetController',
     'BufferOption',
     'UpdateOption',
+    'encode_stream_values',
 ]
 
 
@@ -40,6 +45,130 @@ class UpdateOption(Enum):
     INSERT_NO_COMPRESSION = "InsertNoCompression"  # Insert without compression
     REMOVE = "Remove"  # Remove the value if one exists at specified time
 
+
+@lru_cache(maxsize=4096)
+def _stream_path(web_id: str, suffix: str) -> str:
+    """Build (and cache) the endpoint path for a stream resource.
+
+    Polling clients hit the same few streams repeatedly, so the formatted
+    path is reused instead of rebuilt on every call.
+    """
+    return f"streams/{web_id}/{suffix}"
+
+
+_RECORDED_SPEC = (
+    ("start_time", "startTime", _format_time),
+    ("end_time", "endTime", _format_time),
+    ("boundary_type", "boundaryType", None),
+    ("max_count", "maxCount", None),
+    ("filter_expression", "filterExpression", None),
+    ("selected_fields", "selectedFields", None),
+    ("time_zone", "timeZone", None),
+    ("desired_units", "desiredUnits", None),
+)
+
+_INTERPOLATED_SPEC = (
+    ("start_time", "startTime", _format_time),
+    ("end_time", "endTime", _format_time),
+    ("interval", "interval", None),
+    ("filter_expression", "filterExpression", None),
+    ("selected_fields", "selectedFields", None),
+    ("time_zone", "timeZone", None),
+    ("desired_units", "desiredUnits", None),
+    ("sync_time", "syncTime", _format_time),
+    ("sync_time_boundary_type", "syncTimeBoundaryType", None),
+)
+
+_PLOT_SPEC = (
+    ("start_time", "startTime", _format_time),
+    ("end_time", "endTime", _format_time),
+    ("intervals", "intervals", None),
+    ("selected_fields", "selectedFields", None),
+    ("time_zone", "timeZone", None),
+    ("desired_units", "desiredUnits", None),
+)
+
+_SUMMARY_SPEC = (
+    ("start_time", "startTime", _format_time),
+    ("end_time", "endTime", _format_time),
+    ("summary_type", "summaryType", None),
+    ("summary_duration", "summaryDuration", None),
+    ("calculation_basis", "calculationBasis", None),
+    ("time_type", "timeType", None),
+    ("selected_fields", "selectedFields", None),
+    ("time_zone", "timeZone", None),
+    ("filter_expression", "filterExpression", None),
+)
+
+_VALUE_SPEC = (
+    ("selected_fields", "selectedFields", None),
+    ("time", "time", _format_time),
+    ("desired_units", "desiredUnits", None),
+)
+
+_RETRIEVE_SPEC = (
+    ("selected_fields", "selectedFields", None),
+    ("desired_units", "desiredUnits", None),
+)
+
+_UPDATES_SPEC = (("selected_fields", "selectedFields", None),)
+
+_WEB_IDS = ("web_ids", "webId")
+_INCLUDE_FILTERED = ("include_filtered_values", "includeFilteredValues")
+
+# Query parameter builders, compiled once at import from the specs above
+_VALUE_PARAMS = _make_param_builder(_VALUE_SPEC)
+_RECORDED_PARAMS = _make_param_builder(_RECORDED_SPEC, required=(_INCLUDE_FILTERED,))
+_INTERPOLATED_PARAMS = _make_param_builder(_INTERPOLATED_SPEC, required=(_INCLUDE_FILTERED,))
+_PLOT_PARAMS = _make_param_builder(_PLOT_SPEC)
+_SUMMARY_PARAMS = _make_param_builder(_SUMMARY_SPEC)
+_UPDATES_PARAMS = _make_param_builder(_UPDATES_SPEC)
+_RETRIEVE_UPDATE_PARAMS = _make_param_builder(_RETRIEVE_SPEC)
+_END_PARAMS = _make_param_builder(_RETRIEVE_SPEC)
+
+_SET_VALUE_PARAMS = _make_param_builder(_VALUE_SPEC, required=(_WEB_IDS,))
+_SET_RECORDED_PARAMS = _make_param_builder(
+    _RECORDED_SPEC, required=(_WEB_IDS, _INCLUDE_FILTERED)
+)
+_SET_INTERPOLATED_PARAMS = _make_param_builder(
+    _INTERPOLATED_SPEC, required=(_WEB_IDS, _INCLUDE_FILTERED)
+)
+_SET_PLOT_PARAMS = _make_param_builder(_PLOT_SPEC, required=(_WEB_IDS,))
+_SET_SUMMARY_PARAMS = _make_param_builder(_SUMMARY_SPEC, required=(_WEB_IDS,))
+_SET_UPDATES_PARAMS = _make_param_builder(_UPDATES_SPEC, required=(_WEB_IDS,))
+_SET_RETRIEVE_UPDATES_PARAMS = _make_param_builder(
+    _RETRIEVE_SPEC, required=(("marker", "marker"),)
+)
+
+
+def encode_stream_values(
+    web_ids: Sequence[str],
+    values: Sequence[Any],
+    timestamps: Optional[Sequence[Union[str, datetime, None]]] = None,
+) -> bytes:
+    """Serialize one value per stream into a stream set update payload.
+
+    Args:
+        web_ids: WebIDs of the streams to update
+        values: Value for each stream, aligned with web_ids
+        timestamps: Optional timestamp for each value (str or datetime);
+            values without a timestamp are written at the current time
+
+    Returns:
+        JSON bytes suitable for StreamSetController.update_values_raw()
+    """
+    if timestamps is None:
+        return dumps(
+            [{"WebId": web_id, "Value": {"Value": value}} for web_id, value in zip(web_ids, values)]
+        )
+    return dumps(
+        [
+            {"WebId": web_id, "Value": {"Timestamp": _format_time(timestamp), "Value": value}}
+            for web_id, value, timestamp in zip(web_ids, values, timestamps)
+        ]
+    )
+
+
 class StreamController(BaseController):
     """Controller for Stream operations."""
 
@@ -51,15 +180,25 @@ class StreamController(BaseController):
         desired_units: Optional[str] = None,
     ) -> Dict:
         """Get current stream value."""
-        params = {}
-        if selected_fields:
-            params["selectedFields"] = selected_fields
-        time_str = self._format_time(time)
-        if time_str:
-            params["time"] = time_str
-        if desired_units:
-            params["desiredUnits"] = desired_units
-        return self.client.get(f"streams/{web_id}/value", params=params)
+        params = _VALUE_PARAMS(
+            selected_fields=selected_fields,
+            time=time,
+            desired_units=desired_units,
+        )
+        return self.client.get(_stream_path(web_id, "value"), params=params)
+
+    def get_end(
+        self,
+        web_id: str,
+        selected_fields: Optional[str] = None,
+        desired_units: Optional[str] = None,
+    ) -> Dict:
+        """Get the last recorded value of a stream."""
+        params = _END_PARAMS(
+            selected_fields=selected_fields,
+            desired_units=desired_units,
+        )
+        return self.client.get(_stream_path(web_id, "end"), params=params)
 
     def get_recorded(
         self,
@@ -75,27 +214,18 @@ class StreamController(BaseController):
         desired_units: Optional[str] = None,
     ) -> Dict:
         """Get recorded values."""
-        params = {"includeFilteredValues": include_filtered_values}
-        start_time_str = self._format_time(start_time)
-        if start_time_str:
-            params["startTime"] = start_time_str
-        end_time_str = self._format_time(end_time)
-        if end_time_str:
-            params["endTime"] = end_time_str
-        if boundary_type:
-            params["boundaryType"] = boundary_type
-        if max_count:
-            params["maxCount"] = max_count
-        if filter_expression:
-            params["filterExpression"] = filter_expression
-        if selected_fields:
-            params["selectedFields"] = selected_fields
-        if time_zone:
-            params["timeZone"] = time_zone
-        if desired_units:
-            params["desiredUnits"] = desired_units
-
-        return self.client.get(f"streams/{web_id}/recorded", params=params)
+        params = _RECORDED_PARAMS(
+            include_filtered_values=include_filtered_values,
+            start_time=start_time,
+            end_time=end_time,
+            boundary_type=boundary_type,
+            max_count=max_count,
+            filter_expression=filter_expression,
+            selected_fields=selected_fields,
+            time_zone=time_zone,
+            desired_units=desired_units,
+        )
+        return self.client.get(_stream_path(web_id, "recorded"), params=params)
 
     def get_interpolated(
         self,
@@ -112,30 +242,19 @@ class StreamController(BaseController):
         sync_time_boundary_type: Optional[str] = None,
     ) -> Dict:
         """Get interpolated values."""
-        params = {"includeFilteredValues": include_filtered_values}
-        start_time_str = self._format_time(start_time)
-        if start_time_str:
-            params["startTime"] = start_time_str
-        end_time_str = self._format_time(end_time)
-        if end_time_str:
-            params["endTime"] = end_time_str
-        if interval:
-            params["interval"] = interval
-        if filter_expression:
-            params["filterExpression"] = filter_expression
-        if selected_fields:
-            params["selectedFields"] = selected_fields
-        if time_zone:
-            params["timeZone"] = time_zone
-        if desired_units:
-            params["desiredUnits"] = desired_units
-        sync_time_str = self._format_time(sync_time)
-        if sync_time_str:
-            params["syncTime"] = sync_time_str
-        if sync_time_boundary_type:
-            params["syncTimeBoundaryType"] = sync_time_boundary_type
-
-        return self.client.get(f"streams/{web_id}/interpolated", params=params)
+        params = _INTERPOLATED_PARAMS(
+            include_filtered_values=include_filtered_values,
+            start_time=start_time,
+            end_time=end_time,
+            interval=interval,
+            filter_expression=filter_expression,
+            selected_fields=selected_fields,
+            time_zone=time_zone,
+            desired_units=desired_units,
+            sync_time=sync_time,
+            sync_time_boundary_type=sync_time_boundary_type,
+        )
+        return self.client.get(_stream_path(web_id, "interpolated"), params=params)
 
     def get_plot(
         self,
@@ -148,23 +267,15 @@ class StreamController(BaseController):
         desired_units: Optional[str] = None,
     ) -> Dict:
         """Get plot values."""
-        params = {}
-        start_time_str = self._format_time(start_time)
-        if start_time_str:
-            params["startTime"] = start_time_str
-        end_time_str = self._format_time(end_time)
-        if end_time_str:
-            params["endTime"] = end_time_str
-        if intervals:
-            params["intervals"] = intervals
-        if selected_fields:
-            params["selectedFields"] = selected_fields
-        if time_zone:
-            params["timeZone"] = time_zone
-        if desired_units:
-            params["desiredUnits"] = desired_units
-
-        return self.client.get(f"streams/{web_id}/plot", params=params)
+        params = _PLOT_PARAMS(
+            start_time=start_time,
+            end_time=end_time,
+            intervals=intervals,
+            selected_fields=selected_fields,
+            time_zone=time_zone,
+            desired_units=desired_units,
+        )
+        return self.client.get(_stream_path(web_id, "plot"), params=params)
 
     def get_summary(
         self,
@@ -180,29 +291,18 @@ class StreamController(BaseController):
         filter_expression: Optional[str] = None,
     ) -> Dict:
         """Get summary values."""
-        params = {}
-        start_time_str = self._format_time(start_time)
-        if start_time_str:
-            params["startTime"] = start_time_str
-        end_time_str = self._format_time(end_time)
-        if end_time_str:
-            params["endTime"] = end_time_str
-        if summary_type:
-            params["summaryType"] = summary_type
-        if summary_duration:
-            params["summaryDuration"] = summary_duration
-        if calculation_basis:
-            params["calculationBasis"] = calculation_basis
-        if time_type:
-            params["timeType"] = time_type
-        if selected_fields:
-            params["selectedFields"] = selected_fields
-        if time_zone:
-            params["timeZone"] = time_zone
-        if filter_expression:
-            params["filterExpression"] = filter_expression
-
-        return self.client.get(f"streams/{web_id}/summary", params=params)
+        params = _SUMMARY_PARAMS(
+            start_time=start_time,
+            end_time=end_time,
+            summary_type=summary_type,
+            summary_duration=summary_duration,
+            calculation_basis=calculation_basis,
+            time_type=time_type,
+            selected_fields=selected_fields,
+            time_zone=time_zone,
+            filter_expression=filter_expression,
+        )
+        return self.client.get(_stream_path(web_id, "summary"), params=params)
 
     def update_value(
         self,
@@ -227,7 +327,7 @@ class StreamController(BaseController):
             params["bufferOption"] = buffer_option.value if isinstance(buffer_option, BufferOption) else buffer_option
         if update_option:
             params["updateOption"] = update_option.value if isinstance(update_option, UpdateOption) else update_option
-        return self.client.put(f"streams/{web_id}/value", data=value, params=params)
+        return self.client.put(_stream_path(web_id, "value"), data=value, params=params)
 
     def update_values(
         self,
@@ -252,7 +352,7 @@ class StreamController(BaseController):
             params["bufferOption"] = buffer_option.value if isinstance(buffer_option, BufferOption) else buffer_option
         if update_option:
             params["updateOption"] = update_option.value if isinstance(update_option, UpdateOption) else update_option
-        return self.client.post(f"streams/{web_id}/recorded", data=values, params=params)
+        return self.client.post(_stream_path(web_id, "recorded"), data=values, params=params)
 
     def register_update(
         self,
@@ -271,10 +371,8 @@ class StreamController(BaseController):
         Returns:
             Dictionary with LatestMarker and registration status
         """
-        params = {}
-        if selected_fields:
-            params["selectedFields"] = selected_fields
-        return self.client.post(f"streams/{web_id}/updates", params=params)
+        params = _UPDATES_PARAMS(selected_fields=selected_fields)
+        return self.client.post(_stream_path(web_id, "updates"), params=params)
 
     def retrieve_update(
         self,
@@ -295,12 +393,11 @@ class StreamController(BaseController):
         Returns:
             Dictionary with Items (updates) and LatestMarker
         """
-        params = {}
-        if selected_fields:
-            params["selectedFields"] = selected_fields
-        if desired_units:
-            params["desiredUnits"] = desired_units
-        return self.client.get(f"streams/updates/{marker}", params=params)
+        params = _RETRIEVE_UPDATE_PARAMS(
+            selected_fields=selected_fields,
+            desired_units=desired_units,
+        )
+        return self.client.get("".join(("streams/updates/", marker)), params=params)
 
 
 class StreamSetController(BaseController):
@@ -314,16 +411,61 @@ class StreamSetController(BaseController):
         desired_units: Optional[str] = None,
     ) -> Dict:
         """Get current values for multiple streams."""
-        params = {"webId": web_ids}
-        if selected_fields:
-            params["selectedFields"] = selected_fields
-        time_str = self._format_time(time)
-        if time_str:
-            params["time"] = time_str
-        if desired_units:
-            params["desiredUnits"] = desired_units
+        params = _SET_VALUE_PARAMS(
+            web_ids=web_ids,
+            selected_fields=selected_fields,
+            time=time,
+            desired_units=desired_units,
+        )
         return self.client.get("streamsets/value", params=params)
 
+    async def get_values_async(
+        self,
+        web_ids: List[str],
+        selected_fields: Optional[str] = None,
+        time: Union[str, datetime, None] = None,
+        desired_units: Optional[str] = None,
+        chunks: Optional[int] = None,
+    ) -> Dict:
+        """Get current values for multiple streams with concurrent requests.
+
+        The WebIDs are split into ``chunks`` groups (default: CPU count) that
+        are requested concurrently over one HTTP/2 connection, and their
+        ``Items`` are merged in input order. This only beats get_values()
+        when the server's single bulk request is the bottleneck. Requires
+        the optional ``httpx[http2]`` dependency.
+
+        Args:
+            web_ids: Stream WebIDs
+            selected_fields: Fields to include in each response
+            time: Time to retrieve values at
+            desired_units: Units of measure for returned values
+            chunks: Number of concurrent requests
+
+        Returns:
+            Dictionary with the merged ``Items`` list
+        """
+        chunks = max(1, min(chunks or os.cpu_count() or 1, len(web_ids)))
+        size = -(-len(web_ids) // chunks) or 1
+        async with self.client.async_session() as session:
+            responses = await asyncio.gather(*(
+                self.client.get_async(
+                    session,
+                    "streamsets/value",
+                    params=_SET_VALUE_PARAMS(
+                        web_ids=web_ids[start:start + size],
+                        selected_fields=selected_fields,
+                        time=time,
+                        desired_units=desired_units,
+                    ),
+                )
+                for start in range(0, len(web_ids), size)
+            ))
+        items: List[Dict] = []
+        for response in responses:
+            items.extend(response.get("Items", ()))
+        return {"Items": items}
+
     def get_recorded(
         self,
         web_ids: List[str],
@@ -338,26 +480,18 @@ class StreamSetController(BaseController):
         desired_units: Optional[str] = None,
     ) -> Dict:
         """Get recorded values for multiple streams."""
-        params = {"webId": web_ids, "includeFilteredValues": include_filtered_values}
-        start_time_str = self._format_time(start_time)
-        if start_time_str:
-            params["startTime"] = start_time_str
-        end_time_str = self._format_time(end_time)
-        if end_time_str:
-            params["endTime"] = end_time_str
-        if boundary_type:
-            params["boundaryType"] = boundary_type
-        if max_count:
-            params["maxCount"] = max_count
-        if filter_expression:
-            params["filterExpression"] = filter_expression
-        if selected_fields:
-            params["selectedFields"] = selected_fields
-        if time_zone:
-            params["timeZone"] = time_zone
-        if desired_units:
-            params["desiredUnits"] = desired_units
-
+        params = _SET_RECORDED_PARAMS(
+            web_ids=web_ids,
+            include_filtered_values=include_filtered_values,
+            start_time=start_time,
+            end_time=end_time,
+            boundary_type=boundary_type,
+            max_count=max_count,
+            filter_expression=filter_expression,
+            selected_fields=selected_fields,
+            time_zone=time_zone,
+            desired_units=desired_units,
+        )
         return self.client.get("streamsets/recorded", params=params)
 
     def get_interpolated(
@@ -375,29 +509,19 @@ class StreamSetController(BaseController):
         sync_time_boundary_type: Optional[str] = None,
     ) -> Dict:
         """Get interpolated values for multiple streams."""
-        params = {"webId": web_ids, "includeFilteredValues": include_filtered_values}
-        start_time_str = self._format_time(start_time)
-        if start_time_str:
-            params["startTime"] = start_time_str
-        end_time_str = self._format_time(end_time)
-        if end_time_str:
-            params["endTime"] = end_time_str
-        if interval:
-            params["interval"] = interval
-        if filter_expression:
-            params["filterExpression"] = filter_expression
-        if selected_fields:
-            params["selectedFields"] = selected_fields
-        if time_zone:
-            params["timeZone"] = time_zone
-        if desired_units:
-            params["desiredUnits"] = desired_units
-        sync_time_str = self._format_time(sync_time)
-        if sync_time_str:
-            params["syncTime"] = sync_time_str
-        if sync_time_boundary_type:
-            params["syncTimeBoundaryType"] = sync_time_boundary_type
-
+        params = _SET_INTERPOLATED_PARAMS(
+            web_ids=web_ids,
+            include_filtered_values=include_filtered_values,
+            start_time=start_time,
+            end_time=end_time,
+            interval=interval,
+            filter_expression=filter_expression,
+            selected_fields=selected_fields,
+            time_zone=time_zone,
+            desired_units=desired_units,
+            sync_time=sync_time,
+            sync_time_boundary_type=sync_time_boundary_type,
+        )
         return self.client.get("streamsets/interpolated", params=params)
 
     def get_plot(
@@ -411,22 +535,15 @@ class StreamSetController(BaseController):
         desired_units: Optional[str] = None,
     ) -> Dict:
         """Get plot values for multiple streams."""
-        params = {"webId": web_ids}
-        start_time_str = self._format_time(start_time)
-        if start_time_str:
-            params["startTime"] = start_time_str
-        end_time_str = self._format_time(end_time)
-        if end_time_str:
-            params["endTime"] = end_time_str
-        if intervals:
-            params["intervals"] = intervals
-        if selected_fields:
-            params["selectedFields"] = selected_fields
-        if time_zone:
-            params["timeZone"] = time_zone
-        if desired_units:
-            params["desiredUnits"] = desired_units
-
+        params = _SET_PLOT_PARAMS(
+            web_ids=web_ids,
+            start_time=start_time,
+            end_time=end_time,
+            intervals=intervals,
+            selected_fields=selected_fields,
+            time_zone=time_zone,
+            desired_units=desired_units,
+        )
         return self.client.get("streamsets/plot", params=params)
 
     def get_summaries(
@@ -443,28 +560,18 @@ class StreamSetController(BaseController):
         filter_expression: Optional[str] = None,
     ) -> Dict:
         """Get summary values for multiple streams."""
-        params = {"webId": web_ids}
-        start_time_str = self._format_time(start_time)
-        if start_time_str:
-            params["startTime"] = start_time_str
-        end_time_str = self._format_time(end_time)
-        if end_time_str:
-            params["endTime"] = end_time_str
-        if summary_type:
-            params["summaryType"] = summary_type
-        if summary_duration:
-            params["summaryDuration"] = summary_duration
-        if calculation_basis:
-            params["calculationBasis"] = calculation_basis
-        if time_type:
-            params["timeType"] = time_type
-        if selected_fields:
-            params["selectedFields"] = selected_fields
-        if time_zone:
-            params["timeZone"] = time_zone
-        if filter_expression:
-            params["filterExpression"] = filter_expression
-
+        params = _SET_SUMMARY_PARAMS(
+            web_ids=web_ids,
+            start_time=start_time,
+            end_time=end_time,
+            summary_type=summary_type,
+            summary_duration=summary_duration,
+            calculation_basis=calculation_basis,
+            time_type=time_type,
+            selected_fields=selected_fields,
+            time_zone=time_zone,
+            filter_expression=filter_expression,
+        )
         return self.client.get("streamsets/summaries", params=params)
 
     def update_values(self, updates: List[Dict]) -> Dict:
@@ -473,7 +580,16 @@ class StreamSetController(BaseController):
         Args:
             updates: List of dicts with 'WebId' and 'Value' keys
         """
-        return self.client.put("streamsets/value", data=updates)
+        return self.update_values_raw(dumps(updates))
+
+    def update_values_raw(self, payload: bytes) -> Dict:
+        """Update values for multiple streams from a pre-serialized payload.
+
+        Args:
+            payload: JSON array of {'WebId', 'Value'} objects, e.g. from
+                encode_stream_values()
+        """
+        return self.client.put("streamsets/value", body=payload)
 
     def register_updates(
         self,
@@ -492,9 +608,7 @@ class StreamSetController(BaseController):
         Returns:
             Dictionary with Items containing registration status for each stream and LatestMarker
         """
-        params = {"webId": web_ids}
-        if selected_fields:
-            params["selectedFields"] = selected_fields
+        params = _SET_UPDATES_PARAMS(web_ids=web_ids, selected_fields=selected_fields)
         return self.client.post("streamsets/updates", params=params)
 
     def retrieve_updates(
@@ -516,9 +630,9 @@ class StreamSetController(BaseController):
         Returns:
             Dictionary with Items (updates per stream) and LatestMarker
         """
-        params = {"marker": marker}
-        if selected_fields:
-            params["selectedFields"] = selected_fields
-        if desired_units:
-            params["desiredUnits"] = desired_units
+        params = _SET_RETRIEVE_UPDATES_PARAMS(
+            marker=marker,
+            selected_fields=selected_fields,
+            desired_units=desired_units,
+        )
         return self.client.get("streamsets/updates", params=params)
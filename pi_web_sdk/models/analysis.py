@@ -37,58 +37,31 @@ class Analysis(PIWebAPIObject):
     template_name: Optional[str] = None
     time_rule_plugin_name: Optional[str] = None
     
-    def to_dict(self, exclude_none: bool = True) -> Dict[str, Any]:
-        """Convert to PI Web API format."""
-        result = super().to_dict(exclude_none)
-        
-        if self.analysis_rule_plugin_name is not None or not exclude_none:
-            result['AnalysisRulePlugInName'] = self.analysis_rule_plugin_name
-        if self.auto_created is not None or not exclude_none:
-            result['AutoCreated'] = self.auto_created
-        if self.category_names is not None or not exclude_none:
-            result['CategoryNames'] = self.category_names
-        if self.group_id is not None or not exclude_none:
-            result['GroupId'] = self.group_id
-        if self.has_notification_template is not None or not exclude_none:
-            result['HasNotificationTemplate'] = self.has_notification_template
-        if self.has_target is not None or not exclude_none:
-            result['HasTarget'] = self.has_target
-        if self.has_template is not None or not exclude_none:
-            result['HasTemplate'] = self.has_template
-        if self.is_configured is not None or not exclude_none:
-            result['IsConfigured'] = self.is_configured
-        if self.is_time_rule_defined_by_template is not None or not exclude_none:
-            result['IsTimeRuleDefinedByTemplate'] = self.is_time_rule_defined_by_template
-        if self.maximum_queue_size is not None or not exclude_none:
-            result['MaximumQueueSize'] = self.maximum_queue_size
-        if self.output_time is not None or not exclude_none:
-            result['OutputTime'] = self.output_time
-        if self.priority is not None or not exclude_none:
-            result['Priority'] = self.priority
-        if self.publish_results is not None or not exclude_none:
-            result['PublishResults'] = self.publish_results
-        if self.status is not None or not exclude_none:
-            result['Status'] = self.status
-        if self.target_web_id is not None or not exclude_none:
-            result['TargetWebId'] = self.target_web_id
-        if self.template_name is not None or not exclude_none:
-            result['TemplateName'] = self.template_name
-        if self.time_rule_plugin_name is not None or not exclude_none:
-            result['TimeRulePlugInName'] = self.time_rule_plugin_name
-            
-        return result
+    _FIELDS = PIWebAPIObject._FIELDS + (
+        ('analysis_rule_plugin_name', 'AnalysisRulePlugInName'),
+        ('auto_created', 'AutoCreated'),
+        ('category_names', 'CategoryNames'),
+        ('group_id', 'GroupId'),
+        ('has_notification_template', 'HasNotificationTemplate'),
+        ('has_target', 'HasTarget'),
+        ('has_template', 'HasTemplate'),
+        ('is_configured', 'IsConfigured'),
+        ('is_time_rule_defined_by_template', 'IsTimeRuleDefinedByTemplate'),
+        ('maximum_queue_size', 'MaximumQueueSize'),
+        ('output_time', 'OutputTime'),
+        ('priority', 'Priority'),
+        ('publish_results', 'PublishResults'),
+        ('status', 'Status'),
+        ('target_web_id', 'TargetWebId'),
+        ('template_name', 'TemplateName'),
+        ('time_rule_plugin_name', 'TimeRulePlugInName'),
+    )
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> Analysis:
         """Create from PI Web API response."""
-        base = PIWebAPIObject.from_dict(data)
-        return cls(
-            web_id=base.web_id,
-            id=base.id,
-            name=base.name,
-            description=base.description,
-            path=base.path,
-            links=base.links,
+        kw = PIWebAPIObject._parse_base(data)
+        kw.update(
             analysis_rule_plugin_name=data.get('AnalysisRulePlugInName'),
             auto_created=data.get('AutoCreated'),
             category_names=data.get('CategoryNames'),
@@ -107,6 +80,7 @@ class Analysis(PIWebAPIObject):
             template_name=data.get('TemplateName'),
             time_rule_plugin_name=data.get('TimeRulePlugInName'),
         )
+        return cls(**kw)
 
 
 @dataclass
@@ -122,40 +96,22 @@ class AnalysisTemplate(PIWebAPIObject):
     target_name: Optional[str] = None
     time_rule_plugin_name: Optional[str] = None
     
-    def to_dict(self, exclude_none: bool = True) -> Dict[str, Any]:
-        """Convert to PI Web API format."""
-        result = super().to_dict(exclude_none)
-        
-        if self.analysis_rule_plugin_name is not None or not exclude_none:
-            result['AnalysisRulePlugInName'] = self.analysis_rule_plugin_name
-        if self.category_names is not None or not exclude_none:
-            result['CategoryNames'] = self.category_names
-        if self.create_enabled is not None or not exclude_none:
-            result['CreateEnabled'] = self.create_enabled
-        if self.group_id is not None or not exclude_none:
-            result['GroupId'] = self.group_id
-        if self.has_notification_template is not None or not exclude_none:
-            result['HasNotificationTemplate'] = self.has_notification_template
-        if self.output_time is not None or not exclude_none:
-            result['OutputTime'] = self.output_time
-        if self.target_name is not None or not exclude_none:
-            result['TargetName'] = self.target_name
-        if self.time_rule_plugin_name is not None or not exclude_none:
-            result['TimeRulePlugInName'] = self.time_rule_plugin_name
-            
-        return result
+    _FIELDS = PIWebAPIObject._FIELDS + (
+        ('analysis_rule_plugin_name', 'AnalysisRulePlugInName'),
+        ('category_names', 'CategoryNames'),
+        ('create_enabled', 'CreateEnabled'),
+        ('group_id', 'GroupId'),
+        ('has_notification_template', 'HasNotificationTemplate'),
+        ('output_time', 'OutputTime'),
+        ('target_name', 'TargetName'),
+        ('time_rule_plugin_name', 'TimeRulePlugInName'),
+    )
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> AnalysisTemplate:
         """Create from PI Web API response."""
-        base = PIWebAPIObject.from_dict(data)
-        return cls(
-            web_id=base.web_id,
-            id=base.id,
-            name=base.name,
-            description=base.description,
-            path=base.path,
-            links=base.links,
+        kw = PIWebAPIObject._parse_base(data)
+        kw.update(
             analysis_rule_plugin_name=data.get('AnalysisRulePlugInName'),
             category_names=data.get('CategoryNames'),
             create_enabled=data.get('CreateEnabled'),
@@ -165,6 +121,7 @@ class AnalysisTemplate(PIWebAPIObject):
             target_name=data.get('TargetName'),
             time_rule_plugin_name=data.get('TimeRulePlugInName'),
         )
+        return cls(**kw)
 
 
 @dataclass
@@ -173,28 +130,18 @@ class AnalysisCategory(PIWebAPIObject):
     
     security_descriptor: Optional[str] = None
     
-    def to_dict(self, exclude_none: bool = True) -> Dict[str, Any]:
-        """Convert to PI Web API format."""
-        result = super().to_dict(exclude_none)
-        
-        if self.security_descriptor is not None or not exclude_none:
-            result['SecurityDescriptor'] = self.security_descriptor
-            
-        return result
+    _FIELDS = PIWebAPIObject._FIELDS + (
+        ('security_descriptor', 'SecurityDescriptor'),
+    )
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> AnalysisCategory:
         """Create from PI Web API response."""
-        base = PIWebAPIObject.from_dict(data)
-        return cls(
-            web_id=base.web_id,
-            id=base.id,
-            name=base.name,
-            description=base.description,
-            path=base.path,
-            links=base.links,
+        kw = PIWebAPIObject._parse_base(data)
+        kw.update(
             security_descriptor=data.get('SecurityDescriptor'),
         )
+        return cls(**kw)
 
 
 @dataclass
@@ -210,40 +157,22 @@ class AnalysisRule(PIWebAPIObject):
     plugin_version: Optional[str] = None
     supported_behaviors: Optional[List[str]] = None
     
-    def to_dict(self, exclude_none: bool = True) -> Dict[str, Any]:
-        """Convert to PI Web API format."""
-        result = super().to_dict(exclude_none)
-        
-        if self.configuration_string is not None or not exclude_none:
-            result['ConfigString'] = self.configuration_string
-        if self.display_string is not None or not exclude_none:
-            result['DisplayString'] = self.display_string
-        if self.editor_type is not None or not exclude_none:
-            result['EditorType'] = self.editor_type
-        if self.has_children is not None or not exclude_none:
-            result['HasChildren'] = self.has_children
-        if self.is_configurable is not None or not exclude_none:
-            result['IsConfigurable'] = self.is_configurable
-        if self.is_initializing is not None or not exclude_none:
-            result['IsInitializing'] = self.is_initializing
-        if self.plugin_version is not None or not exclude_none:
-            result['PlugInVersion'] = self.plugin_version
-        if self.supported_behaviors is not None or not exclude_none:
-            result['SupportedBehaviors'] = self.supported_behaviors
-            
-        return result
+    _FIELDS = PIWebAPIObject._FIELDS + (
+        ('configuration_string', 'ConfigString'),
+        ('display_string', 'DisplayString'),
+        ('editor_type', 'EditorType'),
+        ('has_children', 'HasChildren'),
+        ('is_configurable', 'IsConfigurable'),
+        ('is_initializing', 'IsInitializing'),
+        ('plugin_version', 'PlugInVersion'),
+        ('supported_behaviors', 'SupportedBehaviors'),
+    )
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> AnalysisRule:
         """Create from PI Web API response."""
-        base = PIWebAPIObject.from_dict(data)
-        return cls(
-            web_id=base.web_id,
-            id=base.id,
-            name=base.name,
-            description=base.description,
-            path=base.path,
-            links=base.links,
+        kw = PIWebAPIObject._parse_base(data)
+        kw.update(
             configuration_string=data.get('ConfigString'),
             display_string=data.get('DisplayString'),
             editor_type=data.get('EditorType'),
@@ -253,3 +182,4 @@ class AnalysisRule(PIWebAPIObject):
             plugin_version=data.get('PlugInVersion'),
             supported_behaviors=data.get('SupportedBehaviors'),
         )
+        return cls(**kw)
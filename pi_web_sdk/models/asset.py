@@ -24,34 +24,22 @@ class AssetServer(PIWebAPIObject):
     is_connected: Optional[bool] = None
     server_time: Optional[str] = None
     
-    def to_dict(self, exclude_none: bool = True) -> Dict[str, Any]:
-        """Convert to PI Web API format."""
-        result = super().to_dict(exclude_none)
-        
-        if self.server_version is not None or not exclude_none:
-            result['ServerVersion'] = self.server_version
-        if self.is_connected is not None or not exclude_none:
-            result['IsConnected'] = self.is_connected
-        if self.server_time is not None or not exclude_none:
-            result['ServerTime'] = self.server_time
-            
-        return result
+    _FIELDS = PIWebAPIObject._FIELDS + (
+        ('server_version', 'ServerVersion'),
+        ('is_connected', 'IsConnected'),
+        ('server_time', 'ServerTime'),
+    )
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> AssetServer:
         """Create from PI Web API response."""
-        base = PIWebAPIObject.from_dict(data)
-        return cls(
-            web_id=base.web_id,
-            id=base.id,
-            name=base.name,
-            description=base.description,
-            path=base.path,
-            links=base.links,
+        kw = PIWebAPIObject._parse_base(data)
+        kw.update(
             server_version=data.get('ServerVersion'),
             is_connected=data.get('IsConnected'),
             server_time=data.get('ServerTime'),
         )
+        return cls(**kw)
 
 
 @dataclass
@@ -60,28 +48,18 @@ class AssetDatabase(PIWebAPIObject):
     
     extended_properties: Optional[Dict[str, Any]] = None
     
-    def to_dict(self, exclude_none: bool = True) -> Dict[str, Any]:
-        """Convert to PI Web API format."""
-        result = super().to_dict(exclude_none)
-        
-        if self.extended_properties is not None or not exclude_none:
-            result['ExtendedProperties'] = self.extended_properties
-            
-        return result
+    _FIELDS = PIWebAPIObject._FIELDS + (
+        ('extended_properties', 'ExtendedProperties'),
+    )
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> AssetDatabase:
         """Create from PI Web API response."""
-        base = PIWebAPIObject.from_dict(data)
-        return cls(
-            web_id=base.web_id,
-            id=base.id,
-            name=base.name,
-            description=base.description,
-            path=base.path,
-            links=base.links,
+        kw = PIWebAPIObject._parse_base(data)
+        kw.update(
             extended_properties=data.get('ExtendedProperties'),
         )
+        return cls(**kw)
 
 
 @dataclass
@@ -93,37 +71,24 @@ class Element(PIWebAPIObject):
     category_names: Optional[List[str]] = None
     extended_properties: Optional[Dict[str, Any]] = None
     
-    def to_dict(self, exclude_none: bool = True) -> Dict[str, Any]:
-        """Convert to PI Web API format."""
-        result = super().to_dict(exclude_none)
-        
-        if self.template_name is not None or not exclude_none:
-            result['TemplateName'] = self.template_name
-        if self.has_children is not None or not exclude_none:
-            result['HasChildren'] = self.has_children
-        if self.category_names is not None or not exclude_none:
-            result['CategoryNames'] = self.category_names
-        if self.extended_properties is not None or not exclude_none:
-            result['ExtendedProperties'] = self.extended_properties
-            
-        return result
+    _FIELDS = PIWebAPIObject._FIELDS + (
+        ('template_name', 'TemplateName'),
+        ('has_children', 'HasChildren'),
+        ('category_names', 'CategoryNames'),
+        ('extended_properties', 'ExtendedProperties'),
+    )
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> Element:
         """Create from PI Web API response."""
-        base = PIWebAPIObject.from_dict(data)
-        return cls(
-            web_id=base.web_id,
-            id=base.id,
-            name=base.name,
-            description=base.description,
-            path=base.path,
-            links=base.links,
+        kw = PIWebAPIObject._parse_base(data)
+        kw.update(
             template_name=data.get('TemplateName'),
             has_children=data.get('HasChildren'),
             category_names=data.get('CategoryNames'),
             extended_properties=data.get('ExtendedProperties'),
         )
+        return cls(**kw)
 
 
 @dataclass
@@ -132,28 +97,18 @@ class ElementCategory(PIWebAPIObject):
     
     security_descriptor: Optional[str] = None
     
-    def to_dict(self, exclude_none: bool = True) -> Dict[str, Any]:
-        """Convert to PI Web API format."""
-        result = super().to_dict(exclude_none)
-        
-        if self.security_descriptor is not None or not exclude_none:
-            result['SecurityDescriptor'] = self.security_descriptor
-            
-        return result
+    _FIELDS = PIWebAPIObject._FIELDS + (
+        ('security_descriptor', 'SecurityDescriptor'),
+    )
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> ElementCategory:
         """Create from PI Web API response."""
-        base = PIWebAPIObject.from_dict(data)
-        return cls(
-            web_id=base.web_id,
-            id=base.id,
-            name=base.name,
-            description=base.description,
-            path=base.path,
-            links=base.links,
+        kw = PIWebAPIObject._parse_base(data)
+        kw.update(
             security_descriptor=data.get('SecurityDescriptor'),
         )
+        return cls(**kw)
 
 
 @dataclass
@@ -166,37 +121,23 @@ class ElementTemplate(PIWebAPIObject):
     instance_type: Optional[str] = None
     naming_pattern: Optional[str] = None
     
-    def to_dict(self, exclude_none: bool = True) -> Dict[str, Any]:
-        """Convert to PI Web API format."""
-        result = super().to_dict(exclude_none)
-        
-        if self.allow_element_to_extend is not None or not exclude_none:
-            result['AllowElementToExtend'] = self.allow_element_to_extend
-        if self.base_template is not None or not exclude_none:
-            result['BaseTemplate'] = self.base_template
-        if self.category_names is not None or not exclude_none:
-            result['CategoryNames'] = self.category_names
-        if self.instance_type is not None or not exclude_none:
-            result['InstanceType'] = self.instance_type
-        if self.naming_pattern is not None or not exclude_none:
-            result['NamingPattern'] = self.naming_pattern
-            
-        return result
+    _FIELDS = PIWebAPIObject._FIELDS + (
+        ('allow_element_to_extend', 'AllowElementToExtend'),
+        ('base_template', 'BaseTemplate'),
+        ('category_names', 'CategoryNames'),
+        ('instance_type', 'InstanceType'),
+        ('naming_pattern', 'NamingPattern'),
+    )
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> ElementTemplate:
         """Create from PI Web API response."""
-        base = PIWebAPIObject.from_dict(data)
-        return cls(
-            web_id=base.web_id,
-            id=base.id,
-            name=base.name,
-            description=base.description,
-            path=base.path,
-            links=base.links,
+        kw = PIWebAPIObject._parse_base(data)
+        kw.update(
             allow_element_to_extend=data.get('AllowElementToExtend'),
             base_template=data.get('BaseTemplate'),
             category_names=data.get('CategoryNames'),
             instance_type=data.get('InstanceType'),
             naming_pattern=data.get('NamingPattern'),
         )
+        return cls(**kw)
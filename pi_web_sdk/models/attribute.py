@@ -35,54 +35,29 @@ class Attribute(PIWebAPIObject):
     default_value: Optional[Any] = None
     display_digits: Optional[int] = None
     
-    def to_dict(self, exclude_none: bool = True) -> Dict[str, Any]:
-        """Convert to PI Web API format."""
-        result = super().to_dict(exclude_none)
-        
-        if self.type is not None or not exclude_none:
-            result['Type'] = self.type
-        if self.type_qualifier is not None or not exclude_none:
-            result['TypeQualifier'] = self.type_qualifier
-        if self.default_units_name is not None or not exclude_none:
-            result['DefaultUnitsName'] = self.default_units_name
-        if self.data_reference_plugin_name is not None or not exclude_none:
-            result['DataReferencePlugIn'] = self.data_reference_plugin_name
-        if self.config_string is not None or not exclude_none:
-            result['ConfigString'] = self.config_string
-        if self.is_configuration_item is not None or not exclude_none:
-            result['IsConfigurationItem'] = self.is_configuration_item
-        if self.is_excluded is not None or not exclude_none:
-            result['IsExcluded'] = self.is_excluded
-        if self.is_hidden is not None or not exclude_none:
-            result['IsHidden'] = self.is_hidden
-        if self.is_manual_data_entry is not None or not exclude_none:
-            result['IsManualDataEntry'] = self.is_manual_data_entry
-        if self.has_children is not None or not exclude_none:
-            result['HasChildren'] = self.has_children
-        if self.category_names is not None or not exclude_none:
-            result['CategoryNames'] = self.category_names
-        if self.step is not None or not exclude_none:
-            result['Step'] = self.step
-        if self.trait_name is not None or not exclude_none:
-            result['TraitName'] = self.trait_name
-        if self.default_value is not None or not exclude_none:
-            result['DefaultValue'] = self.default_value
-        if self.display_digits is not None or not exclude_none:
-            result['DisplayDigits'] = self.display_digits
-            
-        return result
+    _FIELDS = PIWebAPIObject._FIELDS + (
+        ('type', 'Type'),
+        ('type_qualifier', 'TypeQualifier'),
+        ('default_units_name', 'DefaultUnitsName'),
+        ('data_reference_plugin_name', 'DataReferencePlugIn'),
+        ('config_string', 'ConfigString'),
+        ('is_configuration_item', 'IsConfigurationItem'),
+        ('is_excluded', 'IsExcluded'),
+        ('is_hidden', 'IsHidden'),
+        ('is_manual_data_entry', 'IsManualDataEntry'),
+        ('has_children', 'HasChildren'),
+        ('category_names', 'CategoryNames'),
+        ('step', 'Step'),
+        ('trait_name', 'TraitName'),
+        ('default_value', 'DefaultValue'),
+        ('display_digits', 'DisplayDigits'),
+    )
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> Attribute:
         """Create from PI Web API response."""
-        base = PIWebAPIObject.from_dict(data)
-        return cls(
-            web_id=base.web_id,
-            id=base.id,
-            name=base.name,
-            description=base.description,
-            path=base.path,
-            links=base.links,
+        kw = PIWebAPIObject._parse_base(data)
+        kw.update(
             type=data.get('Type'),
             type_qualifier=data.get('TypeQualifier'),
             default_units_name=data.get('DefaultUnitsName'),
@@ -99,6 +74,7 @@ class Attribute(PIWebAPIObject):
             default_value=data.get('DefaultValue'),
             display_digits=data.get('DisplayDigits'),
         )
+        return cls(**kw)
 
 
 @dataclass
@@ -107,28 +83,18 @@ class AttributeCategory(PIWebAPIObject):
     
     security_descriptor: Optional[str] = None
     
-    def to_dict(self, exclude_none: bool = True) -> Dict[str, Any]:
-        """Convert to PI Web API format."""
-        result = super().to_dict(exclude_none)
-        
-        if self.security_descriptor is not None or not exclude_none:
-            result['SecurityDescriptor'] = self.security_descriptor
-            
-        return result
+    _FIELDS = PIWebAPIObject._FIELDS + (
+        ('security_descriptor', 'SecurityDescriptor'),
+    )
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> AttributeCategory:
         """Create from PI Web API response."""
-        base = PIWebAPIObject.from_dict(data)
-        return cls(
-            web_id=base.web_id,
-            id=base.id,
-            name=base.name,
-            description=base.description,
-            path=base.path,
-            links=base.links,
+        kw = PIWebAPIObject._parse_base(data)
+        kw.update(
             security_descriptor=data.get('SecurityDescriptor'),
         )
+        return cls(**kw)
 
 
 @dataclass
@@ -149,50 +115,27 @@ class AttributeTemplate(PIWebAPIObject):
     trait_name: Optional[str] = None
     default_value: Optional[Any] = None
     
-    def to_dict(self, exclude_none: bool = True) -> Dict[str, Any]:
-        """Convert to PI Web API format."""
-        result = super().to_dict(exclude_none)
-        
-        if self.type is not None or not exclude_none:
-            result['Type'] = self.type
-        if self.type_qualifier is not None or not exclude_none:
-            result['TypeQualifier'] = self.type_qualifier
-        if self.default_units_name is not None or not exclude_none:
-            result['DefaultUnitsName'] = self.default_units_name
-        if self.data_reference_plugin_name is not None or not exclude_none:
-            result['DataReferencePlugIn'] = self.data_reference_plugin_name
-        if self.config_string is not None or not exclude_none:
-            result['ConfigString'] = self.config_string
-        if self.is_configuration_item is not None or not exclude_none:
-            result['IsConfigurationItem'] = self.is_configuration_item
-        if self.is_excluded is not None or not exclude_none:
-            result['IsExcluded'] = self.is_excluded
-        if self.is_hidden is not None or not exclude_none:
-            result['IsHidden'] = self.is_hidden
-        if self.is_manual_data_entry is not None or not exclude_none:
-            result['IsManualDataEntry'] = self.is_manual_data_entry
-        if self.has_children is not None or not exclude_none:
-            result['HasChildren'] = self.has_children
-        if self.category_names is not None or not exclude_none:
-            result['CategoryNames'] = self.category_names
-        if self.trait_name is not None or not exclude_none:
-            result['TraitName'] = self.trait_name
-        if self.default_value is not None or not exclude_none:
-            result['DefaultValue'] = self.default_value
-            
-        return result
+    _FIELDS = PIWebAPIObject._FIELDS + (
+        ('type', 'Type'),
+        ('type_qualifier', 'TypeQualifier'),
+        ('default_units_name', 'DefaultUnitsName'),
+        ('data_reference_plugin_name', 'DataReferencePlugIn'),
+        ('config_string', 'ConfigString'),
+        ('is_configuration_item', 'IsConfigurationItem'),
+        ('is_excluded', 'IsExcluded'),
+        ('is_hidden', 'IsHidden'),
+        ('is_manual_data_entry', 'IsManualDataEntry'),
+        ('has_children', 'HasChildren'),
+        ('category_names', 'CategoryNames'),
+        ('trait_name', 'TraitName'),
+        ('default_value', 'DefaultValue'),
+    )
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> AttributeTemplate:
         """Create from PI Web API response."""
-        base = PIWebAPIObject.from_dict(data)
-        return cls(
-            web_id=base.web_id,
-            id=base.id,
-            name=base.name,
-            description=base.description,
-            path=base.path,
-            links=base.links,
+        kw = PIWebAPIObject._parse_base(data)
+        kw.update(
             type=data.get('Type'),
             type_qualifier=data.get('TypeQualifier'),
             default_units_name=data.get('DefaultUnitsName'),
@@ -207,6 +150,7 @@ class AttributeTemplate(PIWebAPIObject):
             trait_name=data.get('TraitName'),
             default_value=data.get('DefaultValue'),
         )
+        return cls(**kw)
 
 
 @dataclass
@@ -217,31 +161,19 @@ class AttributeTrait(PIWebAPIObject):
     allow_child_attributes: Optional[bool] = None
     allow_data_reference: Optional[bool] = None
     
-    def to_dict(self, exclude_none: bool = True) -> Dict[str, Any]:
-        """Convert to PI Web API format."""
-        result = super().to_dict(exclude_none)
-        
-        if self.abbreviation is not None or not exclude_none:
-            result['Abbreviation'] = self.abbreviation
-        if self.allow_child_attributes is not None or not exclude_none:
-            result['AllowChildAttributes'] = self.allow_child_attributes
-        if self.allow_data_reference is not None or not exclude_none:
-            result['AllowDataReference'] = self.allow_data_reference
-            
-        return result
+    _FIELDS = PIWebAPIObject._FIELDS + (
+        ('abbreviation', 'Abbreviation'),
+        ('allow_child_attributes', 'AllowChildAttributes'),
+        ('allow_data_reference', 'AllowDataReference'),
+    )
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> AttributeTrait:
         """Create from PI Web API response."""
-        base = PIWebAPIObject.from_dict(data)
-        return cls(
-            web_id=base.web_id,
-            id=base.id,
-            name=base.name,
-            description=base.description,
-            path=base.path,
-            links=base.links,
+        kw = PIWebAPIObject._parse_base(data)
+        kw.update(
             abbreviation=data.get('Abbreviation'),
             allow_child_attributes=data.get('AllowChildAttributes'),
             allow_data_reference=data.get('AllowDataReference'),
         )
+        return cls(**kw)
@@ -2,14 +2,50 @@
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, field, asdict
-from typing import Dict, Any, Optional, List
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from datetime import datetime
 
 
-@dataclass
+# dataclass(slots=True) requires Python 3.10+; older versions keep __dict__
+_DATACLASS_SLOTS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+def _compile_to_dict(fields: Tuple[Tuple[str, ...], ...]) -> Callable[..., Dict[str, Any]]:
+    """Generate a straight-line to_dict method from a field table.
+
+    Args:
+        fields: (python_name, api_name) or (python_name, api_name, formatter)
+            tuples, where formatter names a method applied to the value
+
+    Returns:
+        Function usable as a to_dict(self, exclude_none=True) method
+    """
+    lines = ["def to_dict(self, exclude_none=True):", "    result = {}"]
+    for python_name, api_name, *formatter in fields:
+        lines.append(f"    value = self.{python_name}")
+        lines.append("    if value is not None or not exclude_none:")
+        if formatter:
+            lines.append(f"        result[{api_name!r}] = self.{formatter[0]}(value)")
+        else:
+            lines.append(f"        result[{api_name!r}] = value")
+    lines.append("    return result")
+
+    namespace: Dict[str, Any] = {}
+    exec(compile("\n".join(lines) + "\n", "<to_dict>", "exec"), namespace)
+    to_dict = namespace["to_dict"]
+    to_dict.__doc__ = "Convert to PI Web API format."
+    return to_dict
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class PIWebAPIObject:
-    """Base class for all PI Web API objects."""
+    """Base class for all PI Web API objects.
+
+    Subclasses list their serialized fields in a class-level ``_FIELDS``
+    table (including the base fields); ``to_dict`` is generated from it.
+    """
     
     web_id: Optional[str] = None
     id: Optional[str] = None
@@ -17,43 +53,45 @@ class PIWebAPIObject:
     description: Optional[str] = None
     path: Optional[str] = None
     links: Optional[Dict[str, str]] = None
+
+    # Map Python field names to PI Web API field names
+    _FIELDS = (
+        ('web_id', 'WebId'),
+        ('id', 'Id'),
+        ('name', 'Name'),
+        ('description', 'Description'),
+        ('path', 'Path'),
+        ('links', 'Links'),
+    )
+
+    to_dict = _compile_to_dict(_FIELDS)
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        # Explicit super(): slots=True re-creates the class, breaking the bare form
+        super(PIWebAPIObject, cls).__init_subclass__(**kwargs)
+        if '_FIELDS' in cls.__dict__ and 'to_dict' not in cls.__dict__:
+            cls.to_dict = _compile_to_dict(cls._FIELDS)
     
-    def to_dict(self, exclude_none: bool = True) -> Dict[str, Any]:
-        """Convert to dictionary format expected by PI Web API.
-        
-        Args:
-            exclude_none: If True, exclude None values from output
+    @staticmethod
+    def _parse_base(data: Dict[str, Any]) -> Dict[str, Any]:
+        """Extract the base field kwargs from PI Web API response data.
+
+        Subclass from_dict() methods extend the returned dict with their own
+        fields and pass it to cls(**kw), avoiding a throwaway base instance.
         """
-        result = {}
-        
-        # Map Python field names to PI Web API field names
-        field_mapping = {
-            'web_id': 'WebId',
-            'id': 'Id',
-            'name': 'Name',
-            'description': 'Description',
-            'path': 'Path',
-            'links': 'Links',
+        return {
+            'web_id': data.get('WebId'),
+            'id': data.get('Id'),
+            'name': data.get('Name'),
+            'description': data.get('Description'),
+            'path': data.get('Path'),
+            'links': data.get('Links'),
         }
-        
-        for python_name, api_name in field_mapping.items():
-            value = getattr(self, python_name, None)
-            if value is not None or not exclude_none:
-                result[api_name] = value
-        
-        return result
-    
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> PIWebAPIObject:
         """Create instance from PI Web API response data."""
-        return cls(
-            web_id=data.get('WebId'),
-            id=data.get('Id'),
-            name=data.get('Name'),
-            description=data.get('Description'),
-            path=data.get('Path'),
-            links=data.get('Links'),
-        )
+        return cls(**PIWebAPIObject._parse_base(data))
 
 
 @dataclass
@@ -25,34 +25,22 @@ class DataServer(PIWebAPIObject):
     is_connected: Optional[bool] = None
     server_time: Optional[str] = None
     
-    def to_dict(self, exclude_none: bool = True) -> Dict[str, Any]:
-        """Convert to PI Web API format."""
-        result = super().to_dict(exclude_none)
-        
-        if self.server_version is not None or not exclude_none:
-            result['ServerVersion'] = self.server_version
-        if self.is_connected is not None or not exclude_none:
-            result['IsConnected'] = self.is_connected
-        if self.server_time is not None or not exclude_none:
-            result['ServerTime'] = self.server_time
-            
-        return result
+    _FIELDS = PIWebAPIObject._FIELDS + (
+        ('server_version', 'ServerVersion'),
+        ('is_connected', 'IsConnected'),
+        ('server_time', 'ServerTime'),
+    )
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> DataServer:
         """Create from PI Web API response."""
-        base = PIWebAPIObject.from_dict(data)
-        return cls(
-            web_id=base.web_id,
-            id=base.id,
-            name=base.name,
-            description=base.description,
-            path=base.path,
-            links=base.links,
+        kw = PIWebAPIObject._parse_base(data)
+        kw.update(
             server_version=data.get('ServerVersion'),
             is_connected=data.get('IsConnected'),
             server_time=data.get('ServerTime'),
         )
+        return cls(**kw)
 
 
 @dataclass
@@ -67,38 +55,21 @@ class Point(PIWebAPIObject):
     future: Optional[bool] = None
     display_digits: Optional[int] = None
     
-    def to_dict(self, exclude_none: bool = True) -> Dict[str, Any]:
-        """Convert to PI Web API format."""
-        result = super().to_dict(exclude_none)
-        
-        if self.point_class is not None or not exclude_none:
-            result['PointClass'] = self.point_class
-        if self.point_type is not None or not exclude_none:
-            result['PointType'] = self.point_type
-        if self.digital_set_name is not None or not exclude_none:
-            result['DigitalSetName'] = self.digital_set_name
-        if self.engineering_units is not None or not exclude_none:
-            result['EngineeringUnits'] = self.engineering_units
-        if self.step is not None or not exclude_none:
-            result['Step'] = self.step
-        if self.future is not None or not exclude_none:
-            result['Future'] = self.future
-        if self.display_digits is not None or not exclude_none:
-            result['DisplayDigits'] = self.display_digits
-            
-        return result
+    _FIELDS = PIWebAPIObject._FIELDS + (
+        ('point_class', 'PointClass'),
+        ('point_type', 'PointType'),
+        ('digital_set_name', 'DigitalSetName'),
+        ('engineering_units', 'EngineeringUnits'),
+        ('step', 'Step'),
+        ('future', 'Future'),
+        ('display_digits', 'DisplayDigits'),
+    )
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> Point:
         """Create from PI Web API response."""
-        base = PIWebAPIObject.from_dict(data)
-        return cls(
-            web_id=base.web_id,
-            id=base.id,
-            name=base.name,
-            description=base.description,
-            path=base.path,
-            links=base.links,
+        kw = PIWebAPIObject._parse_base(data)
+        kw.update(
             point_class=data.get('PointClass'),
             point_type=data.get('PointType'),
             digital_set_name=data.get('DigitalSetName'),
@@ -107,6 +78,7 @@ class Point(PIWebAPIObject):
             future=data.get('Future'),
             display_digits=data.get('DisplayDigits'),
         )
+        return cls(**kw)
 
 
 @dataclass
@@ -19,28 +19,18 @@ class EnumerationSet(PIWebAPIObject):
     
     serializable: Optional[bool] = None
     
-    def to_dict(self, exclude_none: bool = True) -> Dict[str, Any]:
-        """Convert to PI Web API format."""
-        result = super().to_dict(exclude_none)
-        
-        if self.serializable is not None or not exclude_none:
-            result['Serializable'] = self.serializable
-            
-        return result
+    _FIELDS = PIWebAPIObject._FIELDS + (
+        ('serializable', 'Serializable'),
+    )
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> EnumerationSet:
         """Create from PI Web API response."""
-        base = PIWebAPIObject.from_dict(data)
-        return cls(
-            web_id=base.web_id,
-            id=base.id,
-            name=base.name,
-            description=base.description,
-            path=base.path,
-            links=base.links,
+        kw = PIWebAPIObject._parse_base(data)
+        kw.update(
             serializable=data.get('Serializable'),
         )
+        return cls(**kw)
 
 
 @dataclass
@@ -51,31 +41,19 @@ class EnumerationValue(PIWebAPIObject):
     parent: Optional[str] = None
     serializable: Optional[bool] = None
     
-    def to_dict(self, exclude_none: bool = True) -> Dict[str, Any]:
-        """Convert to PI Web API format."""
-        result = super().to_dict(exclude_none)
-        
-        if self.value is not None or not exclude_none:
-            result['Value'] = self.value
-        if self.parent is not None or not exclude_none:
-            result['Parent'] = self.parent
-        if self.serializable is not None or not exclude_none:
-            result['Serializable'] = self.serializable
-            
-        return result
+    _FIELDS = PIWebAPIObject._FIELDS + (
+        ('value', 'Value'),
+        ('parent', 'Parent'),
+        ('serializable', 'Serializable'),
+    )
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> EnumerationValue:
         """Create from PI Web API response."""
-        base = PIWebAPIObject.from_dict(data)
-        return cls(
-            web_id=base.web_id,
-            id=base.id,
-            name=base.name,
-            description=base.description,
-            path=base.path,
-            links=base.links,
+        kw = PIWebAPIObject._parse_base(data)
+        kw.update(
             value=data.get('Value'),
             parent=data.get('Parent'),
             serializable=data.get('Serializable'),
         )
+        return cls(**kw)
@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
+import operator
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Dict, Any, Optional, List, Union
-from .base import PIWebAPIObject
+from .base import _DATACLASS_SLOTS, PIWebAPIObject
 
 
 __all__ = [
@@ -14,7 +15,7 @@ __all__ = [
 ]
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class EventFrame(PIWebAPIObject):
     """PI AF Event Frame object."""
 
@@ -33,7 +34,30 @@ class EventFrame(PIWebAPIObject):
     severity: Optional[str] = None
     start_time: Union[str, datetime, None] = None
     template_name: Optional[str] = None
-    
+
+    _FIELDS = PIWebAPIObject._FIELDS + (
+        ('acknowledge_date', 'AcknowledgeDate', '_format_time'),
+        ('acknowledged_by', 'AcknowledgedBy'),
+        ('are_values_captured', 'AreValuesCaptured'),
+        ('can_be_acknowledged', 'CanBeAcknowledged'),
+        ('category_names', 'CategoryNames'),
+        ('end_time', 'EndTime', '_format_time'),
+        ('has_children', 'HasChildren'),
+        ('is_acknowledged', 'IsAcknowledged'),
+        ('is_annotation', 'IsAnnotation'),
+        ('is_locked', 'IsLocked'),
+        ('referenced_element_web_id', 'ReferencedElementWebId'),
+        ('security_descriptor', 'SecurityDescriptor'),
+        ('severity', 'Severity'),
+        ('start_time', 'StartTime', '_format_time'),
+        ('template_name', 'TemplateName'),
+    )
+
+    # _FIELDS follows the dataclass field order, so its API names can be
+    # fetched in one C-level call and passed to __init__ positionally
+    _GETTER = operator.itemgetter(*(api_name for _, api_name, *_ in _FIELDS))
+    _API_NAMES = frozenset(api_name for _, api_name, *_ in _FIELDS)
+
     def _format_time(self, time_value: Union[str, datetime, None]) -> Optional[str]:
         """Convert time value to PI Web API compatible string format."""
         if time_value is None:
@@ -47,55 +71,12 @@ class EventFrame(PIWebAPIObject):
                 time_str = time_str[:-6] + 'Z'
             return time_str
         raise TypeError(f"Time value must be str, datetime, or None, got {type(time_value)}")
-
-    def to_dict(self, exclude_none: bool = True) -> Dict[str, Any]:
-        """Convert to PI Web API format."""
-        result = super().to_dict(exclude_none)
-
-        if self.acknowledge_date is not None or not exclude_none:
-            result['AcknowledgeDate'] = self._format_time(self.acknowledge_date)
-        if self.acknowledged_by is not None or not exclude_none:
-            result['AcknowledgedBy'] = self.acknowledged_by
-        if self.are_values_captured is not None or not exclude_none:
-            result['AreValuesCaptured'] = self.are_values_captured
-        if self.can_be_acknowledged is not None or not exclude_none:
-            result['CanBeAcknowledged'] = self.can_be_acknowledged
-        if self.category_names is not None or not exclude_none:
-            result['CategoryNames'] = self.category_names
-        if self.end_time is not None or not exclude_none:
-            result['EndTime'] = self._format_time(self.end_time)
-        if self.has_children is not None or not exclude_none:
-            result['HasChildren'] = self.has_children
-        if self.is_acknowledged is not None or not exclude_none:
-            result['IsAcknowledged'] = self.is_acknowledged
-        if self.is_annotation is not None or not exclude_none:
-            result['IsAnnotation'] = self.is_annotation
-        if self.is_locked is not None or not exclude_none:
-            result['IsLocked'] = self.is_locked
-        if self.referenced_element_web_id is not None or not exclude_none:
-            result['ReferencedElementWebId'] = self.referenced_element_web_id
-        if self.security_descriptor is not None or not exclude_none:
-            result['SecurityDescriptor'] = self.security_descriptor
-        if self.severity is not None or not exclude_none:
-            result['Severity'] = self.severity
-        if self.start_time is not None or not exclude_none:
-            result['StartTime'] = self._format_time(self.start_time)
-        if self.template_name is not None or not exclude_none:
-            result['TemplateName'] = self.template_name
-
-        return result
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> EventFrame:
         """Create from PI Web API response."""
-        base = PIWebAPIObject.from_dict(data)
-        return cls(
-            web_id=base.web_id,
-            id=base.id,
-            name=base.name,
-            description=base.description,
-            path=base.path,
-            links=base.links,
+        kw = PIWebAPIObject._parse_base(data)
+        kw.update(
             acknowledge_date=data.get('AcknowledgeDate'),
             acknowledged_by=data.get('AcknowledgedBy'),
             are_values_captured=data.get('AreValuesCaptured'),
@@ -112,33 +93,41 @@ class EventFrame(PIWebAPIObject):
             start_time=data.get('StartTime'),
             template_name=data.get('TemplateName'),
         )
+        return cls(**kw)
+
+    @classmethod
+    def from_list(cls, items: List[Dict[str, Any]]) -> List[EventFrame]:
+        """Create event frames from a list of PI Web API response items.
+
+        The path is chosen once per batch: when the first item carries every
+        field (no selectedFields trimming), each item is built positionally
+        from a single itemgetter call. Otherwise, or if a later item turns
+        out to be partial, the whole batch goes through from_dict().
+        """
+        if items and cls._API_NAMES <= items[0].keys():
+            getter = cls._GETTER
+            try:
+                return [cls(*getter(item)) for item in items]
+            except KeyError:
+                pass
+        return [cls.from_dict(item) for item in items]
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class EventFrameCategory(PIWebAPIObject):
     """PI AF Event Frame Category object."""
     
     security_descriptor: Optional[str] = None
     
-    def to_dict(self, exclude_none: bool = True) -> Dict[str, Any]:
-        """Convert to PI Web API format."""
-        result = super().to_dict(exclude_none)
-        
-        if self.security_descriptor is not None or not exclude_none:
-            result['SecurityDescriptor'] = self.security_descriptor
-            
-        return result
+    _FIELDS = PIWebAPIObject._FIELDS + (
+        ('security_descriptor', 'SecurityDescriptor'),
+    )
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> EventFrameCategory:
         """Create from PI Web API response."""
-        base = PIWebAPIObject.from_dict(data)
-        return cls(
-            web_id=base.web_id,
-            id=base.id,
-            name=base.name,
-            description=base.description,
-            path=base.path,
-            links=base.links,
+        kw = PIWebAPIObject._parse_base(data)
+        kw.update(
             security_descriptor=data.get('SecurityDescriptor'),
         )
+        return cls(**kw)
@@ -218,7 +218,12 @@ class OMFAsset:
 
 @dataclass
 class OMFTimeSeriesData:
-    """Represents OMF time series data."""
+    """Represents OMF time series data.
+
+    ``values`` is a list of dicts, or a NumPy structured array whose field
+    names are the type's property names (serialized one object per record;
+    add_data_point(s) require a list).
+    """
     container_id: str
     values: List[Dict[str, Any]]
     
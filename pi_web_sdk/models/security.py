@@ -20,28 +20,18 @@ class SecurityIdentity(PIWebAPIObject):
     
     is_enabled: Optional[bool] = None
     
-    def to_dict(self, exclude_none: bool = True) -> Dict[str, Any]:
-        """Convert to PI Web API format."""
-        result = super().to_dict(exclude_none)
-        
-        if self.is_enabled is not None or not exclude_none:
-            result['IsEnabled'] = self.is_enabled
-            
-        return result
+    _FIELDS = PIWebAPIObject._FIELDS + (
+        ('is_enabled', 'IsEnabled'),
+    )
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> SecurityIdentity:
         """Create from PI Web API response."""
-        base = PIWebAPIObject.from_dict(data)
-        return cls(
-            web_id=base.web_id,
-            id=base.id,
-            name=base.name,
-            description=base.description,
-            path=base.path,
-            links=base.links,
+        kw = PIWebAPIObject._parse_base(data)
+        kw.update(
             is_enabled=data.get('IsEnabled'),
         )
+        return cls(**kw)
 
 
 @dataclass
@@ -51,31 +41,20 @@ class SecurityMapping(PIWebAPIObject):
     account: Optional[str] = None
     security_identity_web_id: Optional[str] = None
     
-    def to_dict(self, exclude_none: bool = True) -> Dict[str, Any]:
-        """Convert to PI Web API format."""
-        result = super().to_dict(exclude_none)
-        
-        if self.account is not None or not exclude_none:
-            result['Account'] = self.account
-        if self.security_identity_web_id is not None or not exclude_none:
-            result['SecurityIdentityWebId'] = self.security_identity_web_id
-            
-        return result
+    _FIELDS = PIWebAPIObject._FIELDS + (
+        ('account', 'Account'),
+        ('security_identity_web_id', 'SecurityIdentityWebId'),
+    )
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> SecurityMapping:
         """Create from PI Web API response."""
-        base = PIWebAPIObject.from_dict(data)
-        return cls(
-            web_id=base.web_id,
-            id=base.id,
-            name=base.name,
-            description=base.description,
-            path=base.path,
-            links=base.links,
+        kw = PIWebAPIObject._parse_base(data)
+        kw.update(
             account=data.get('Account'),
             security_identity_web_id=data.get('SecurityIdentityWebId'),
         )
+        return cls(**kw)
 
 
 @dataclass
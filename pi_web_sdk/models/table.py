@@ -23,37 +23,24 @@ class Table(PIWebAPIObject):
     default_value: Optional[Any] = None
     time_zone: Optional[str] = None
     
-    def to_dict(self, exclude_none: bool = True) -> Dict[str, Any]:
-        """Convert to PI Web API format."""
-        result = super().to_dict(exclude_none)
-        
-        if self.category_names is not None or not exclude_none:
-            result['CategoryNames'] = self.category_names
-        if self.converted_data_type is not None or not exclude_none:
-            result['ConvertedDataType'] = self.converted_data_type
-        if self.default_value is not None or not exclude_none:
-            result['DefaultValue'] = self.default_value
-        if self.time_zone is not None or not exclude_none:
-            result['TimeZone'] = self.time_zone
-            
-        return result
+    _FIELDS = PIWebAPIObject._FIELDS + (
+        ('category_names', 'CategoryNames'),
+        ('converted_data_type', 'ConvertedDataType'),
+        ('default_value', 'DefaultValue'),
+        ('time_zone', 'TimeZone'),
+    )
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> Table:
         """Create from PI Web API response."""
-        base = PIWebAPIObject.from_dict(data)
-        return cls(
-            web_id=base.web_id,
-            id=base.id,
-            name=base.name,
-            description=base.description,
-            path=base.path,
-            links=base.links,
+        kw = PIWebAPIObject._parse_base(data)
+        kw.update(
             category_names=data.get('CategoryNames'),
             converted_data_type=data.get('ConvertedDataType'),
             default_value=data.get('DefaultValue'),
             time_zone=data.get('TimeZone'),
         )
+        return cls(**kw)
 
 
 @dataclass
@@ -62,28 +49,18 @@ class TableCategory(PIWebAPIObject):
     
     security_descriptor: Optional[str] = None
     
-    def to_dict(self, exclude_none: bool = True) -> Dict[str, Any]:
-        """Convert to PI Web API format."""
-        result = super().to_dict(exclude_none)
-        
-        if self.security_descriptor is not None or not exclude_none:
-            result['SecurityDescriptor'] = self.security_descriptor
-            
-        return result
+    _FIELDS = PIWebAPIObject._FIELDS + (
+        ('security_descriptor', 'SecurityDescriptor'),
+    )
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> TableCategory:
         """Create from PI Web API response."""
-        base = PIWebAPIObject.from_dict(data)
-        return cls(
-            web_id=base.web_id,
-            id=base.id,
-            name=base.name,
-            description=base.description,
-            path=base.path,
-            links=base.links,
+        kw = PIWebAPIObject._parse_base(data)
+        kw.update(
             security_descriptor=data.get('SecurityDescriptor'),
         )
+        return cls(**kw)
 
 
 @dataclass
@@ -25,38 +25,21 @@ class TimeRule(PIWebAPIObject):
     merge_duplicate_events: Optional[bool] = None
     plugin_version: Optional[str] = None
     
-    def to_dict(self, exclude_none: bool = True) -> Dict[str, Any]:
-        """Convert to PI Web API format."""
-        result = super().to_dict(exclude_none)
-        
-        if self.configuration_string is not None or not exclude_none:
-            result['ConfigString'] = self.configuration_string
-        if self.display_string is not None or not exclude_none:
-            result['DisplayString'] = self.display_string
-        if self.editor_type is not None or not exclude_none:
-            result['EditorType'] = self.editor_type
-        if self.is_configurable is not None or not exclude_none:
-            result['IsConfigurable'] = self.is_configurable
-        if self.is_initializing is not None or not exclude_none:
-            result['IsInitializing'] = self.is_initializing
-        if self.merge_duplicate_events is not None or not exclude_none:
-            result['MergeDuplicateEvents'] = self.merge_duplicate_events
-        if self.plugin_version is not None or not exclude_none:
-            result['PlugInVersion'] = self.plugin_version
-            
-        return result
+    _FIELDS = PIWebAPIObject._FIELDS + (
+        ('configuration_string', 'ConfigString'),
+        ('display_string', 'DisplayString'),
+        ('editor_type', 'EditorType'),
+        ('is_configurable', 'IsConfigurable'),
+        ('is_initializing', 'IsInitializing'),
+        ('merge_duplicate_events', 'MergeDuplicateEvents'),
+        ('plugin_version', 'PlugInVersion'),
+    )
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> TimeRule:
         """Create from PI Web API response."""
-        base = PIWebAPIObject.from_dict(data)
-        return cls(
-            web_id=base.web_id,
-            id=base.id,
-            name=base.name,
-            description=base.description,
-            path=base.path,
-            links=base.links,
+        kw = PIWebAPIObject._parse_base(data)
+        kw.update(
             configuration_string=data.get('ConfigString'),
             display_string=data.get('DisplayString'),
             editor_type=data.get('EditorType'),
@@ -65,6 +48,7 @@ class TimeRule(PIWebAPIObject):
             merge_duplicate_events=data.get('MergeDuplicateEvents'),
             plugin_version=data.get('PlugInVersion'),
         )
+        return cls(**kw)
 
 
 @dataclass
@@ -81,42 +65,23 @@ class TimeRulePlugIn(PIWebAPIObject):
     load_exception: Optional[str] = None
     plugin_version: Optional[str] = None
     
-    def to_dict(self, exclude_none: bool = True) -> Dict[str, Any]:
-        """Convert to PI Web API format."""
-        result = super().to_dict(exclude_none)
-        
-        if self.assembly_file_name is not None or not exclude_none:
-            result['AssemblyFileName'] = self.assembly_file_name
-        if self.assembly_id is not None or not exclude_none:
-            result['AssemblyID'] = self.assembly_id
-        if self.assembly_load_properties is not None or not exclude_none:
-            result['AssemblyLoadProperties'] = self.assembly_load_properties
-        if self.assembly_time is not None or not exclude_none:
-            result['AssemblyTime'] = self.assembly_time
-        if self.compatibility_version is not None or not exclude_none:
-            result['CompatibilityVersion'] = self.compatibility_version
-        if self.is_browsable is not None or not exclude_none:
-            result['IsBrowsable'] = self.is_browsable
-        if self.is_enabled is not None or not exclude_none:
-            result['IsEnabled'] = self.is_enabled
-        if self.load_exception is not None or not exclude_none:
-            result['LoadException'] = self.load_exception
-        if self.plugin_version is not None or not exclude_none:
-            result['PlugInVersion'] = self.plugin_version
-            
-        return result
+    _FIELDS = PIWebAPIObject._FIELDS + (
+        ('assembly_file_name', 'AssemblyFileName'),
+        ('assembly_id', 'AssemblyID'),
+        ('assembly_load_properties', 'AssemblyLoadProperties'),
+        ('assembly_time', 'AssemblyTime'),
+        ('compatibility_version', 'CompatibilityVersion'),
+        ('is_browsable', 'IsBrowsable'),
+        ('is_enabled', 'IsEnabled'),
+        ('load_exception', 'LoadException'),
+        ('plugin_version', 'PlugInVersion'),
+    )
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> TimeRulePlugIn:
         """Create from PI Web API response."""
-        base = PIWebAPIObject.from_dict(data)
-        return cls(
-            web_id=base.web_id,
-            id=base.id,
-            name=base.name,
-            description=base.description,
-            path=base.path,
-            links=base.links,
+        kw = PIWebAPIObject._parse_base(data)
+        kw.update(
             assembly_file_name=data.get('AssemblyFileName'),
             assembly_id=data.get('AssemblyID'),
             assembly_load_properties=data.get('AssemblyLoadProperties'),
@@ -127,3 +92,4 @@ class TimeRulePlugIn(PIWebAPIObject):
             load_exception=data.get('LoadException'),
             plugin_version=data.get('PlugInVersion'),
         )
+        return cls(**kw)
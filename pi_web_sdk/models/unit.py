@@ -24,36 +24,20 @@ class Unit(PIWebAPIObject):
     reference_offset: Optional[float] = None
     reference_unit_abbreviation: Optional[str] = None
     
-    def to_dict(self, exclude_none: bool = True) -> Dict[str, Any]:
-        """Convert to PI Web API format."""
-        result = super().to_dict(exclude_none)
-        
-        if self.abbreviation is not None or not exclude_none:
-            result['Abbreviation'] = self.abbreviation
-        if self.factor is not None or not exclude_none:
-            result['Factor'] = self.factor
-        if self.offset is not None or not exclude_none:
-            result['Offset'] = self.offset
-        if self.reference_factor is not None or not exclude_none:
-            result['ReferenceFactor'] = self.reference_factor
-        if self.reference_offset is not None or not exclude_none:
-            result['ReferenceOffset'] = self.reference_offset
-        if self.reference_unit_abbreviation is not None or not exclude_none:
-            result['ReferenceUnitAbbreviation'] = self.reference_unit_abbreviation
-            
-        return result
+    _FIELDS = PIWebAPIObject._FIELDS + (
+        ('abbreviation', 'Abbreviation'),
+        ('factor', 'Factor'),
+        ('offset', 'Offset'),
+        ('reference_factor', 'ReferenceFactor'),
+        ('reference_offset', 'ReferenceOffset'),
+        ('reference_unit_abbreviation', 'ReferenceUnitAbbreviation'),
+    )
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> Unit:
         """Create from PI Web API response."""
-        base = PIWebAPIObject.from_dict(data)
-        return cls(
-            web_id=base.web_id,
-            id=base.id,
-            name=base.name,
-            description=base.description,
-            path=base.path,
-            links=base.links,
+        kw = PIWebAPIObject._parse_base(data)
+        kw.update(
             abbreviation=data.get('Abbreviation'),
             factor=data.get('Factor'),
             offset=data.get('Offset'),
@@ -61,6 +45,7 @@ class Unit(PIWebAPIObject):
             reference_offset=data.get('ReferenceOffset'),
             reference_unit_abbreviation=data.get('ReferenceUnitAbbreviation'),
         )
+        return cls(**kw)
 
 
 @dataclass
@@ -70,28 +55,17 @@ class UnitClass(PIWebAPIObject):
     canonical_unit_name: Optional[str] = None
     canonical_unit_abbreviation: Optional[str] = None
     
-    def to_dict(self, exclude_none: bool = True) -> Dict[str, Any]:
-        """Convert to PI Web API format."""
-        result = super().to_dict(exclude_none)
-        
-        if self.canonical_unit_name is not None or not exclude_none:
-            result['CanonicalUnitName'] = self.canonical_unit_name
-        if self.canonical_unit_abbreviation is not None or not exclude_none:
-            result['CanonicalUnitAbbreviation'] = self.canonical_unit_abbreviation
-            
-        return result
+    _FIELDS = PIWebAPIObject._FIELDS + (
+        ('canonical_unit_name', 'CanonicalUnitName'),
+        ('canonical_unit_abbreviation', 'CanonicalUnitAbbreviation'),
+    )
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> UnitClass:
         """Create from PI Web API response."""
-        base = PIWebAPIObject.from_dict(data)
-        return cls(
-            web_id=base.web_id,
-            id=base.id,
-            name=base.name,
-            description=base.description,
-            path=base.path,
-            links=base.links,
+        kw = PIWebAPIObject._parse_base(data)
+        kw.update(
             canonical_unit_name=data.get('CanonicalUnitName'),
             canonical_unit_abbreviation=data.get('CanonicalUnitAbbreviation'),
         )
+        return cls(**kw)
@@ -13,15 +13,25 @@ Key differences from traditional API:
 - Write-only; queries still use traditional API
 """
 
-import math
+import asyncio
+import json
+import os
 import time
 from datetime import datetime, timedelta, timezone
-from typing import Dict, List
+from typing import Callable, Dict, List, Optional
+from urllib.parse import quote
+
+import numpy as np
+
+try:
+    import numexpr
+except ImportError:  # numexpr not installed; use plain NumPy expressions
+    numexpr = None
 
 from pi_web_sdk import AuthMethod, PIWebAPIClient, PIWebAPIConfig, WebIDType
+from pi_web_sdk.controllers.omf import OMFManager
 from pi_web_sdk.exceptions import PIWebAPIError
 from pi_web_sdk.models.omf import (
-    OMFManager,
     OMFType,
     OMFProperty,
     OMFContainer,
@@ -37,11 +47,290 @@ BASE_URL = "https://172.30.136.15/piwebapi"
 USERNAME = None
 PASSWORD = None
 DATABASE_NAME = "Default"  # Target AF database name
+OMF_CONCURRENCY = 8  # Maximum OMF data messages in flight at once
+OMF_BATCH_SIZE = 10000  # Data points per OMF data message
+OMF_STREAM_CHUNK = 256  # Data points serialized per streamed body chunk
+# Sensor values (25-75, two decimals) are sent as int16 hundredths of a unit
+VALUE_SCALE = 0.01
+# Waveform periods in seconds for each generated container
+SINE_PERIODS = {"sine1": 60, "sine2": 120, "sine3": 180}
+SQUARE_PERIODS = {"square1": 100, "square2": 200, "square3": 300}
+
+
+def poll_until(
+    predicate: Callable[[], bool], timeout: float = 5.0, interval: float = 0.1
+) -> bool:
+    """Call predicate until it returns True or timeout seconds have passed.
+
+    PIWebAPIErrors raised by the predicate (e.g. a resource that does not
+    exist yet) count as False. Returns whether the predicate succeeded.
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            if predicate():
+                return True
+        except PIWebAPIError:
+            pass
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(interval)
+
+
+def sine_wave(secs: np.ndarray, period: int) -> np.ndarray:
+    """Evaluate 50 + 25*sin(2*pi*secs/period) over an array of offsets.
+
+    numexpr fuses the expression into one multithreaded pass (~3x faster
+    here). The square waves stay on np.where, which numexpr does not speed up.
+    """
+    if numexpr is not None:
+        return numexpr.evaluate(
+            "50 + 25 * sin(2 * pi * secs / period)",
+            local_dict={"secs": secs, "period": period, "pi": np.pi},
+        )
+    return 50 + 25 * np.sin(2 * np.pi * secs / period)
+
+
+def _unwrap_value(item: Dict) -> float:
+    """Return a stream item's numeric value, or NaN for system states and text."""
+    value = item.get("Value")
+    if type(value) is dict:
+        # Digital/system states such as "No Data" arrive as value objects
+        value = None if value.get("IsSystem", False) else value.get("Value")
+    return value if type(value) in (int, float) else np.nan
+
+
+def _plain_value(item: Dict) -> float:
+    """Return a stream item's Value, assumed to be a plain number."""
+    value = item.get("Value")
+    if type(value) in (int, float):
+        return value
+    raise TypeError(f"Unexpected stream value: {value!r}")
+
+
+def make_extractor(sample: Dict) -> Callable[[Dict], float]:
+    """Pick a value extractor for stream items shaped like sample.
+
+    A stream's items share one Value shape, so numeric streams skip the
+    value-object unwrapping. Both extractors accept the same values (ints and
+    floats, not bools or strings); the plain one raises TypeError on any
+    other item so the caller can fall back to _unwrap_value.
+    """
+    if type(sample.get("Value")) in (int, float):
+        return _plain_value
+    return _unwrap_value
+
+
+def numeric_values(items: List[Dict]) -> np.ndarray:
+    """Collect the numeric values of stream items into a float64 array."""
+    if not items:
+        return np.empty(0)
+    try:
+        values = np.fromiter(map(make_extractor(items[0]), items), np.float64, len(items))
+    except TypeError:  # Mixed shapes, e.g. a system state mid-stream
+        values = np.fromiter(map(_unwrap_value, items), np.float64, len(items))
+    return values[~np.isnan(values)]
 
 
 def utc_iso(dt: datetime) -> str:
     """Convert datetime to ISO 8601 UTC format."""
-    return dt.astimezone(timezone.utc).isoformat().replace("+00:00", "Z")
+    if dt.tzinfo is not timezone.utc:
+        dt = dt.astimezone(timezone.utc)
+    # UTC isoformat() always ends in "+00:00"
+    return dt.isoformat()[:-6] + "Z"
+
+
+# AF hierarchy for use case 1: (element_webids key, parent key, name, description).
+# Parents are listed before their children.
+HIERARCHY = (
+    ("IndyIQ", None, "IndyIQ_OMF", "Root for OMF demo"),
+    ("IndyIQ\\Model", "IndyIQ", "Model", "Model container"),
+    *(
+        (f"IndyIQ\\Model\\Model{i}", "IndyIQ\\Model", f"Model{i}", f"Model instance {i}")
+        for i in range(1, 4)
+    ),
+)
+
+
+def create_hierarchy_batch(
+    client: PIWebAPIClient, db_web_id: str, db_path: str
+) -> Dict[str, Dict]:
+    """Get or create the HIERARCHY elements using at most two batch requests.
+
+    The first batch looks every element up by path. The second creates the
+    missing ones: a child of a new element is posted to the parent's Location
+    header, and each create is followed by a GET of the new element, so the
+    server resolves the whole chain in one round trip.
+
+    Returns:
+        Element objects keyed like HIERARCHY
+    """
+    base_url = client.config.base_url.rstrip("/")
+    # Sub-requests bypass the client, so request its WebID format explicitly
+    web_id_type = f"webIdType={client.config.webid_type.value}"
+    paths: Dict[str, str] = {}
+    for key, parent, name, _ in HIERARCHY:
+        paths[key] = f"{paths[parent] if parent else db_path}\\{name}"
+
+    lookup = client.batch.execute({
+        f"get{index}": {
+            "Method": "GET",
+            "Resource": f"{base_url}/elements?path={quote(paths[key], safe='')}&{web_id_type}",
+        }
+        for index, (key, _, _, _) in enumerate(HIERARCHY)
+    })
+
+    elements: Dict[str, Dict] = {}
+    for index, (key, _, _, _) in enumerate(HIERARCHY):
+        response = lookup.get(f"get{index}", {})
+        if response.get("Status") == 200:
+            elements[key] = response["Content"]
+            print(f"  {paths[key]} already exists")
+
+    requests = {}
+    created_indexes: Dict[str, int] = {}
+    for index, (key, parent, name, description) in enumerate(HIERARCHY):
+        if key in elements:
+            continue
+        create = {
+            "Method": "POST",
+            "Content": json.dumps({"Name": name, "Description": description}),
+        }
+        if parent is None:
+            create["Resource"] = f"{base_url}/assetdatabases/{db_web_id}/elements?{web_id_type}"
+        elif parent in elements:
+            create["Resource"] = (
+                f"{base_url}/elements/{elements[parent]['WebId']}/elements?{web_id_type}"
+            )
+        else:
+            parent_id = f"create{created_indexes[parent]}"
+            create["Resource"] = f"{{0}}/elements?{web_id_type}"
+            create["ParentIds"] = [parent_id]
+            create["Parameters"] = [f"$.{parent_id}.Headers.Location"]
+        created_indexes[key] = index
+        requests[f"create{index}"] = create
+        requests[f"get{index}"] = {
+            "Method": "GET",
+            "Resource": f"{{0}}?{web_id_type}",
+            "ParentIds": [f"create{index}"],
+            "Parameters": [f"$.create{index}.Headers.Location"],
+        }
+
+    if requests:
+        created = client.batch.execute(requests)
+        for key, index in created_indexes.items():
+            response = created.get(f"get{index}", {})
+            if response.get("Status") != 200:
+                raise PIWebAPIError(f"Failed to create {paths[key]}")
+            elements[key] = response["Content"]
+            print(f"  [OK] Created {paths[key]}")
+
+    return elements
+
+
+# PI Point WebIDs of OMF containers, keyed by container ID
+_POINT_WEBIDS: Dict[str, str] = {}
+# Shortest tag-mask prefix searched in one query; shorter ones match too widely
+MIN_MASK_PREFIX = 8
+POINT_PAGE_SIZE = 1000  # Points per data server search page
+
+
+def resolve_point_webids(
+    client: PIWebAPIClient, data_server_webid: str, container_ids: List[str]
+) -> Dict[str, str]:
+    """Return the WebIDs of the PI Points OMF created for the containers.
+
+    OMF names each point after its container ID ("<model_id>_<name>"), so
+    uncached points are found with one "<model_id>_*" tag-mask search, paged
+    until every point is found. If the IDs share no such prefix, each point
+    is looked up by name. Found WebIDs are cached; containers without a
+    point are left out of the result.
+    """
+    missing = [container_id for container_id in container_ids if container_id not in _POINT_WEBIDS]
+    prefix = os.path.commonprefix(missing)
+    # Cut back to the last separator so the mask names one model's containers
+    prefix = prefix[:prefix.rfind("_") + 1]
+    if len(prefix) >= MIN_MASK_PREFIX:
+        # Point names are case-insensitive
+        wanted = {container_id.upper(): container_id for container_id in missing}
+        page_size = max(len(missing), POINT_PAGE_SIZE)
+        start_index = 0
+        while wanted:
+            items = client.data_server.get_points(
+                data_server_webid,
+                name_filter=f"{prefix}*",
+                start_index=start_index,
+                max_count=page_size,
+            ).get("Items", [])
+            for point in items:
+                container_id = wanted.pop(point["Name"].upper(), None)
+                if container_id:
+                    _POINT_WEBIDS[container_id] = point["WebId"]
+            if len(items) < page_size:
+                break
+            start_index += page_size
+    else:
+        # Too short a mask would page through most of the server's points
+        for container_id in missing:
+            point = client.data_server.find_point_by_name(data_server_webid, container_id)
+            if point:
+                _POINT_WEBIDS[container_id] = point["WebId"]
+
+    return {
+        container_id: _POINT_WEBIDS[container_id]
+        for container_id in container_ids
+        if container_id in _POINT_WEBIDS
+    }
+
+
+async def send_batches_concurrently(
+    omf_manager: OMFManager,
+    batches_by_container: List[List[OMFTimeSeriesData]],
+    limit: int = OMF_CONCURRENCY,
+) -> List[List]:
+    """Send OMF time-series batches, concurrently across containers.
+
+    Each container's batches are sent one after another, so they reach the
+    archive in order, and a container stops at its first failed batch. At
+    most ``limit`` requests are in flight at once. Uses one HTTP/2 session
+    when httpx is installed; otherwise the sync client's sends run in worker
+    threads.
+
+    Returns one list per container, in order, holding the responses of the
+    batches sent; a failed container's list ends with the PIWebAPIError.
+    """
+    semaphore = asyncio.Semaphore(limit)
+
+    async def send_container(send, batches: List[OMFTimeSeriesData]) -> List:
+        results = []
+        for batch in batches:
+            async with semaphore:
+                try:
+                    results.append(await send(batch))
+                except PIWebAPIError as exc:
+                    results.append(exc)
+                    break
+        return results
+
+    try:
+        session = omf_manager.client.async_session()
+    except PIWebAPIError:  # httpx not installed
+        loop = asyncio.get_running_loop()
+
+        def send_sync(batch: OMFTimeSeriesData):
+            return loop.run_in_executor(None, omf_manager.send_time_series_data, batch)
+
+        return await asyncio.gather(
+            *(send_container(send_sync, batches) for batches in batches_by_container)
+        )
+
+    async with session:
+        def send_async(batch: OMFTimeSeriesData):
+            return omf_manager.send_time_series_data_async(session, batch)
+
+        return await asyncio.gather(
+            *(send_container(send_async, batches) for batches in batches_by_container)
+        )
 
 
 def create_client() -> PIWebAPIClient:
@@ -128,42 +417,57 @@ def use_case_1_create_hierarchy_omf(
                     if elem["Name"] == name:
                         print(f"  {full_path} already exists")
                         return elem
-            except:
-                pass
+            except PIWebAPIError as exc:
+                if exc.status_code != 404:
+                    raise
 
             # Create new
             element_def = {"Name": name, "Description": description}
 
             if is_root:
-                client.asset_database.create_element(parent_webid, element_def)
+                created = client.asset_database.create_element(parent_webid, element_def)
             else:
-                client.element.create_element(parent_webid, element_def)
+                created = client.element.create_element(parent_webid, element_def)
 
-            time.sleep(0.5)
+            # The client reads the new WebID from the response's Location header
+            if created.get("WebId"):
+                print(f"  [OK] Created {full_path}")
+                return {"Name": name, "WebId": created["WebId"]}
 
-            # Retrieve
-            if is_root:
-                result = client.asset_database.get_elements(parent_webid, name_filter=name)
-            else:
-                result = client.element.get_elements(parent_webid, name_filter=name)
+            # No Location header: retrieve as soon as the new element is visible
+            found = []
+
+            def element_visible():
+                if is_root:
+                    result = client.asset_database.get_elements(parent_webid, name_filter=name)
+                else:
+                    result = client.element.get_elements(parent_webid, name_filter=name)
+                found[:] = [elem for elem in result.get("Items", []) if elem["Name"] == name]
+                return bool(found)
 
-            for elem in result.get("Items", []):
-                if elem["Name"] == name:
-                    print(f"  [OK] Created {full_path}")
-                    return elem
+            if poll_until(element_visible):
+                print(f"  [OK] Created {full_path}")
+                return found[0]
 
             raise Exception(f"Failed to create {name}")
 
-        # Create hierarchy
-        indyiq = create_or_get_element(db_web_id, "IndyIQ_OMF", "Root for OMF demo", db_path, is_root=True)
-        element_webids["IndyIQ"] = indyiq["WebId"]
+        # Create hierarchy in batch requests; fall back to one call per element
+        try:
+            elements = create_hierarchy_batch(client, db_web_id, db_path)
+            for key, _, _, _ in HIERARCHY:
+                element_webids[key] = elements[key]["WebId"]
+        except PIWebAPIError as exc:
+            print(f"  Batch creation failed ({exc.message}), creating elements one by one...")
+
+            indyiq = create_or_get_element(db_web_id, "IndyIQ_OMF", "Root for OMF demo", db_path, is_root=True)
+            element_webids["IndyIQ"] = indyiq["WebId"]
 
-        model = create_or_get_element(indyiq["WebId"], "Model", "Model container", f"{db_path}\\IndyIQ_OMF", is_root=False)
-        element_webids["IndyIQ\\Model"] = model["WebId"]
+            model = create_or_get_element(indyiq["WebId"], "Model", "Model container", f"{db_path}\\IndyIQ_OMF", is_root=False)
+            element_webids["IndyIQ\\Model"] = model["WebId"]
 
-        for i in range(1, 4):
-            m = create_or_get_element(model["WebId"], f"Model{i}", f"Model instance {i}", f"{db_path}\\IndyIQ_OMF\\Model", is_root=False)
-            element_webids[f"IndyIQ\\Model\\Model{i}"] = m["WebId"]
+            for i in range(1, 4):
+                m = create_or_get_element(model["WebId"], f"Model{i}", f"Model instance {i}", f"{db_path}\\IndyIQ_OMF\\Model", is_root=False)
+                element_webids[f"IndyIQ\\Model\\Model{i}"] = m["WebId"]
 
         print("\n[OK] Created AF hierarchy:")
         print(f"     {db_path}\\IndyIQ_OMF")
@@ -212,7 +516,9 @@ def use_case_1_create_hierarchy_omf(
 def use_case_2_create_attributes_and_data_omf(
     client: PIWebAPIClient,
     omf_manager: OMFManager,
-    element_ids: Dict[str, str]
+    element_ids: Dict[str, str],
+    batch_size: int = OMF_BATCH_SIZE,
+    now: Optional[datetime] = None,
 ) -> tuple[Dict[str, str], Dict[str, str]]:
     """
     Use Case 2: Create containers and populate with time-series data using OMF
@@ -221,7 +527,8 @@ def use_case_2_create_attributes_and_data_omf(
     - sine1, sine2, sine3 (sine waves with different frequencies)
     - square1, square2, square3 (square waves with different periods)
 
-    Populates with 2 days of data at 10-second intervals using OMF data messages.
+    Populates with 2 days of data at 10-second intervals using OMF data messages
+    of up to ``batch_size`` points each, ending at ``now`` (default: current time).
 
     Returns:
         Tuple of (container_ids dict, container_ids dict)
@@ -254,8 +561,9 @@ def use_case_2_create_attributes_and_data_omf(
             timestamp_property="timestamp",
             additional_properties={
                 "value": OMFProperty(
-                    type=PropertyType.NUMBER,
-                    description="Sensor value"
+                    type=PropertyType.INTEGER,
+                    description=f"Sensor value in units of {VALUE_SCALE}",
+                    format="int16",
                 ),
             },
             description="Time-series sensor data type"
@@ -286,7 +594,7 @@ def use_case_2_create_attributes_and_data_omf(
         # Generate and send time-series data
         print("\n3. Generating historical time-series data (2 days at 10-second intervals)...")
 
-        end_time = datetime.now(timezone.utc)
+        end_time = now or datetime.now(timezone.utc)
         start_time = end_time - timedelta(days=2)
         interval_seconds = 10
 
@@ -296,70 +604,67 @@ def use_case_2_create_attributes_and_data_omf(
 
         print(f"  Generating {num_points} data points per container...")
 
-        successful_writes = 0
-        failed_writes = 0
+        # Every container shares the same time grid: format the timestamps once
+        secs = np.arange(num_points, dtype=np.int64) * interval_seconds
+        ts = np.datetime64(start_time.replace(tzinfo=None), "s") + secs.astype("timedelta64[s]")
+        # "YYYY-MM-DDTHH:MM:SSZ" is 20 characters; np.char.add over-allocates
+        ts_strings = np.char.add(np.datetime_as_string(ts, unit="s"), "Z").astype("U20")
+
+        # One compact record per point; serialized to OMF objects per batch
+        point_dtype = np.dtype([("timestamp", ts_strings.dtype), ("value", np.int16)])
+
+        # Build every container's batches first, then send them all concurrently
+        batches_by_container: Dict[str, List[OMFTimeSeriesData]] = {}
 
         for container_name, container_id in container_ids.items():
             print(f"\n  Processing {container_name}")
             print(f"    Container ID: {container_id}")
 
-            values = []
-
-            for i in range(num_points):
-                timestamp_value = start_time + timedelta(seconds=i * interval_seconds)
-
-                # Generate value based on container type
-                if container_name.startswith("sine"):
-                    # Sine waves with different periods
-                    period_map = {"sine1": 60, "sine2": 120, "sine3": 180}
-                    period = period_map[container_name]
-                    value = 50 + 25 * math.sin(2 * math.pi * i * interval_seconds / period)
-                else:  # square waves
-                    period_map = {"square1": 100, "square2": 200, "square3": 300}
-                    period = period_map[container_name]
-                    cycle_position = (i * interval_seconds) % period
-                    value = 75 if cycle_position < period / 2 else 25
-
-                values.append({
-                    "timestamp": utc_iso(timestamp_value),
-                    "value": round(value, 2),
-                })
-
-            # Create OMF time-series data message
-            ts_data = OMFTimeSeriesData(
-                container_id=container_id,
-                values=values
-            )
+            # Generate values based on container type
+            if container_name in SINE_PERIODS:
+                vals = sine_wave(secs, SINE_PERIODS[container_name])
+            else:  # square waves
+                period = SQUARE_PERIODS[container_name]
+                vals = np.where(secs % period < period / 2, 75.0, 25.0)
+
+            values = np.empty(num_points, dtype=point_dtype)
+            values["timestamp"] = ts_strings
+            values["value"] = np.round(vals / VALUE_SCALE).astype(np.int16)
 
             # Send data in batches to avoid timeout
-            batch_size = 5000  # OMF can handle larger batches than traditional API
             total_batches = (len(values) + batch_size - 1) // batch_size
 
-            print(f"  Writing data for {container_name} ({len(values)} points in {total_batches} batches)...")
-
-            write_error = False
-            for batch_idx in range(0, len(values), batch_size):
-                batch_values = values[batch_idx:batch_idx + batch_size]
-                batch_num = batch_idx // batch_size + 1
+            print(f"  Prepared {container_name} ({len(values)} points in {total_batches} batches)")
 
-                try:
-                    # Create batch-specific time-series data
-                    batch_ts_data = OMFTimeSeriesData(
-                        container_id=container_id,
-                        values=batch_values
-                    )
+            # Slicing the structured array is a view; no per-batch copy
+            batches_by_container[container_name] = [
+                OMFTimeSeriesData(
+                    container_id=container_id,
+                    values=values[batch_idx:batch_idx + batch_size]
+                )
+                for batch_idx in range(0, len(values), batch_size)
+            ]
 
-                    omf_manager.send_time_series_data(batch_ts_data)
+        print(
+            f"\n  Writing {len(batches_by_container)} containers "
+            f"(up to {OMF_CONCURRENCY} requests in flight)..."
+        )
+        results = asyncio.run(
+            send_batches_concurrently(omf_manager, list(batches_by_container.values()))
+        )
 
-                    if batch_num % 2 == 0 or batch_num == total_batches:
-                        print(f"    Batch {batch_num}/{total_batches} complete")
+        failed_containers = set()
+        for container_name, container_results in zip(batches_by_container, results):
+            if container_results and isinstance(container_results[-1], PIWebAPIError):
+                batch_num = len(container_results)
+                message = container_results[-1].message
+                print(f"  [X] Error writing batch {batch_num} for {container_name}: {message}")
+                failed_containers.add(container_name)
 
-                except PIWebAPIError as exc:
-                    print(f"  [X] Error writing batch {batch_num} for {container_name}: {exc.message}")
-                    write_error = True
-                    break
-
-            if write_error:
+        successful_writes = 0
+        failed_writes = 0
+        for container_name in container_ids:
+            if container_name in failed_containers:
                 failed_writes += 1
                 print(f"[X] FAILED data write for {container_name}")
             else:
@@ -369,9 +674,26 @@ def use_case_2_create_attributes_and_data_omf(
         print(f"\nData write summary: {successful_writes} successful, {failed_writes} failed")
 
         if successful_writes > 0:
-            print("\nWaiting 10 seconds for OMF buffer to flush data to archive...")
-            time.sleep(10)
-            print("[OK] Buffer flush wait complete")
+            # Wait until the last point of one written container reaches the archive
+            print("\nWaiting for OMF buffer to flush data to archive...")
+            probe_id = next(
+                container_ids[name] for name in container_ids if name not in failed_containers
+            )
+            last_timestamp = str(ts_strings[-1])
+
+            def data_archived():
+                point_webid = resolve_point_webids(
+                    client, omf_manager.data_server_web_id, [probe_id]
+                ).get(probe_id)
+                if not point_webid:
+                    return False
+                end = client.stream.get_end(point_webid, selected_fields="Timestamp")
+                return end.get("Timestamp", "") >= last_timestamp
+
+            if poll_until(data_archived, timeout=15, interval=0.5):
+                print("[OK] Buffer flush complete")
+            else:
+                print("[X] Data not yet visible after 15 seconds; continuing")
 
         print("\n[OK] Container creation and data population complete!")
         print(f"    Created {len(container_ids)} OMF containers")
@@ -493,6 +815,7 @@ def use_case_4_get_interpolated_values(
     container_ids: Dict[str, str],
     days: int = 1,
     interval_seconds: int = 30,
+    now: Optional[datetime] = None,
 ) -> Dict[str, List[Dict]]:
     """
     Use Case 4: Get interpolated values at specified sampling rate
@@ -505,6 +828,7 @@ def use_case_4_get_interpolated_values(
         container_ids: Dictionary mapping container names to container IDs
         days: Number of days to retrieve (default: 1)
         interval_seconds: Sampling interval in seconds (default: 30)
+        now: End of the query range (default: current time)
 
     Returns:
         Dictionary mapping container names to their interpolated values
@@ -515,7 +839,7 @@ def use_case_4_get_interpolated_values(
     print("\nNote: OMF is write-only, using traditional API for queries")
 
     # Query the same time range where we wrote data
-    end_time = datetime.now(timezone.utc)
+    end_time = now or datetime.now(timezone.utc)
     start_time = end_time - timedelta(days=days)
 
     print("\nNote: Querying data from the OMF-created streams")
@@ -553,68 +877,61 @@ def use_case_4_get_interpolated_values(
         print(f"[X] Could not get data server: {exc.message}")
         return {}
 
+    # Resolve all containers' PI Points with one search; later calls hit the cache
+    try:
+        webids_by_container = resolve_point_webids(
+            client, data_server_webid, list(container_ids.values())
+        )
+    except PIWebAPIError as exc:
+        print(f"  [X] Error resolving PI Points - {exc.message}")
+        return {container_name: [] for container_name in container_ids}
+
+    point_webids = {}
     for container_name, container_id in container_ids.items():
-        # Try to find the PI Point created by OMF container
-        # OMF typically creates points with the container ID as the name
+        point_webid = webids_by_container.get(container_id)
+        if not point_webid:
+            print(f"  [X] {container_name:10s}: Point not found (container ID: {container_id})")
+            continue
+        point_webids[container_name] = point_webid
+
+    # Get interpolated values for all points in one stream set request
+    result = {}
+    if point_webids:
         try:
-            # Search for point by name (container ID)
-            point = client.data_server.find_point_by_name(data_server_webid, container_id)
-
-            if not point:
-                print(f"  [X] {container_name:10s}: Point not found (container ID: {container_id})")
-                continue
-
-            point_webid = point["WebId"]
-
-            # Get interpolated values
-            result = client.stream.get_interpolated(
-                web_id=point_webid,
+            result = client.streamset.get_interpolated(
+                web_ids=list(point_webids.values()),
                 start_time=utc_iso(start_time),
                 end_time=utc_iso(end_time),
                 interval=f"{interval_seconds}s",
             )
+        except PIWebAPIError as exc:
+            print(f"  [X] Error retrieving data - {exc.message}")
 
-            values = result.get("Items", [])
-            interpolated_data[container_name] = values
-
-            # Calculate statistics
-            if values:
-                numeric_values = []
-                for v in values:
-                    val = v.get("Value")
-                    if val is not None:
-                        try:
-                            # Handle different value formats
-                            if isinstance(val, dict):
-                                # Skip system values
-                                if not val.get("IsSystem", False):
-                                    numeric_values.append(float(val.get("Value", val)))
-                            elif isinstance(val, str):
-                                numeric_values.append(float(val))
-                            elif isinstance(val, (int, float)):
-                                numeric_values.append(float(val))
-                        except (ValueError, TypeError, KeyError):
-                            pass
-
-                if numeric_values:
-                    avg_value = sum(numeric_values) / len(numeric_values)
-                    min_value = min(numeric_values)
-                    max_value = max(numeric_values)
-
-                    print(
-                        f"  [OK] {container_name:10s}: {len(values):5d} points | "
-                        f"Avg: {avg_value:6.2f} | Min: {min_value:6.2f} | Max: {max_value:6.2f}"
-                    )
-                else:
-                    print(
-                        f"  [OK] {container_name:10s}: {len(values):5d} points (no numeric data)"
-                    )
-            else:
-                print(f"  [X] {container_name:10s}: No data returned")
+    values_by_webid = {
+        stream.get("WebId"): stream.get("Items", []) for stream in result.get("Items", [])
+    }
 
-        except PIWebAPIError as exc:
-            print(f"  [X] {container_name}: Error retrieving data - {exc.message}")
-            interpolated_data[container_name] = []
+    for container_name, point_webid in point_webids.items():
+        values = values_by_webid.get(point_webid, [])
+        interpolated_data[container_name] = values
+
+        # Calculate statistics
+        if values:
+            # Points store int16 hundredths; report in engineering units
+            numeric = VALUE_SCALE * numeric_values(values)
+
+            if numeric.size:
+                print(
+                    f"  [OK] {container_name:10s}: {len(values):5d} points | "
+                    f"Avg: {numeric.mean():6.2f} | Min: {numeric.min():6.2f} | "
+                    f"Max: {numeric.max():6.2f}"
+                )
+            else:
+                print(
+                    f"  [OK] {container_name:10s}: {len(values):5d} points (no numeric data)"
+                )
+        else:
+            print(f"  [X] {container_name:10s}: No data returned")
 
     print("\n[OK] Interpolated data retrieval complete!")
     return interpolated_data
@@ -644,7 +961,9 @@ def main() -> None:
         data_server_webid = servers["Items"][0]["WebId"]
         data_server_name = servers["Items"][0]["Name"]
 
-        omf_manager = OMFManager(client, data_server_webid)
+        omf_manager = OMFManager(
+            client, data_server_webid, compression="gzip", chunk_size=OMF_STREAM_CHUNK
+        )
         print(f"[OK] OMF manager initialized with data server: {data_server_name}")
 
     except PIWebAPIError as exc:
@@ -654,9 +973,13 @@ def main() -> None:
         # Use Case 1: Create hierarchy with OMF
         element_ids = use_case_1_create_hierarchy_omf(client, omf_manager)
 
+        # Use cases 2 and 4 share one clock reading, so the query range
+        # lines up exactly with the written data
+        now = datetime.now(timezone.utc)
+
         # Use Case 2: Create containers and populate data with OMF
         container_ids, _ = use_case_2_create_attributes_and_data_omf(
-            client, omf_manager, element_ids
+            client, omf_manager, element_ids, now=now
         )
 
         # Use Case 3: Get all numeric attributes (traditional API)
@@ -672,7 +995,7 @@ def main() -> None:
         # Use Case 4: Get interpolated values (traditional API)
         if container_ids:
             interpolated_data = use_case_4_get_interpolated_values(
-                client, container_ids, days=1, interval_seconds=30
+                client, container_ids, days=1, interval_seconds=30, now=now
             )
 
         print("\n" + "=" * 80)
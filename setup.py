@@ -0,0 +1,45 @@
+"""Build script for the optional compiled extensions.
+
+Project metadata lives in pyproject.toml. This script only adds the Cython
+speedups; when Cython or a C compiler is unavailable the package installs
+as pure Python.
+
+The hot controller modules are also compiled as-is (Cython pure-Python
+mode), so their .py sources stay importable when the build is skipped.
+Set PI_WEB_SDK_PURE_PYTHON=1 to skip them explicitly.
+"""
+
+import os
+
+from setuptools import Extension, setup
+
+# Pure-Python controller modules compiled for lower interpreter overhead
+COMPILED_CONTROLLERS = () if os.environ.get("PI_WEB_SDK_PURE_PYTHON") else ("base", "stream")
+
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    ext_modules = []
+else:
+    ext_modules = cythonize(
+        [
+            Extension(
+                "pi_web_sdk._cyutil.encode",
+                ["pi_web_sdk/_cyutil/encode.pyx"],
+                optional=True,
+            ),
+            *[
+                Extension(
+                    f"pi_web_sdk.controllers.{module}",
+                    [f"pi_web_sdk/controllers/{module}.py"],
+                    optional=True,
+                )
+                for module in COMPILED_CONTROLLERS
+            ],
+        ],
+        language_level=3,
+        # Type hints stay advisory, matching the pure-Python semantics
+        compiler_directives={"annotation_typing": False},
+    )
+
+setup(ext_modules=ext_modules)
@@ -0,0 +1,221 @@
+"""Tests for PIWebAPIClient request handling."""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+import json
+from unittest.mock import MagicMock
+from urllib.parse import parse_qsl, urlsplit
+
+import pytest
+import requests
+
+from pi_web_sdk.client import PIWebAPIClient, _encode_query
+from pi_web_sdk.config import AuthMethod, PIWebAPIConfig
+from pi_web_sdk.exceptions import PIWebAPIError
+
+
+def _response(status_code=200, content=b"", headers=None):
+    """Build a fake requests.Response."""
+    response = MagicMock()
+    response.status_code = status_code
+    response.content = content
+    response.text = content.decode("utf-8")
+    response.headers = headers or {}
+    return response
+
+
+@pytest.fixture
+def client():
+    """Create a client whose session requests are mocked."""
+    client = PIWebAPIClient(
+        PIWebAPIConfig(base_url="https://server/piwebapi", auth_method=AuthMethod.ANONYMOUS)
+    )
+    client.session.request = MagicMock()
+    return client
+
+
+class TestResponseParsing:
+    """Test parsing of PI Web API responses."""
+
+    def test_json_body(self, client):
+        """Test that JSON bodies are decoded from the raw response bytes."""
+        client.session.request.return_value = _response(
+            content='{"Items": [{"Name": "Température"}]}'.encode("utf-8")
+        )
+        assert client.get("streams/W1/recorded") == {"Items": [{"Name": "Température"}]}
+
+    def test_json_body_with_bom(self, client):
+        """Test that a leading UTF-8 BOM does not stop the body being decoded."""
+        client.session.request.return_value = _response(content=b'\xef\xbb\xbf{"Items": []}')
+        assert client.get("points/P1") == {"Items": []}
+
+    def test_empty_body_uses_location_header(self, client):
+        """Test that an empty create response returns the WebId from Location."""
+        client.session.request.return_value = _response(
+            status_code=201,
+            headers={"Location": "https://server/piwebapi/elements/E1abc"},
+        )
+        result = client.post("elements/E0/elements", data={"Name": "child"})
+        assert result["WebId"] == "E1abc"
+        assert result["content"] == ""
+
+    def test_error_message_from_json(self, client):
+        """Test that the first entry of Errors becomes the error message."""
+        client.session.request.return_value = _response(
+            status_code=400, content=b'{"Errors": ["Bad request body"]}'
+        )
+        with pytest.raises(PIWebAPIError) as excinfo:
+            client.get("points/P1")
+        assert "Bad request body" in str(excinfo.value)
+        assert excinfo.value.status_code == 400
+
+
+class TestConnectionPool:
+    """Test HTTP connection pooling setup."""
+
+    def test_adapters_mounted(self, client):
+        """Test that both schemes use one pooled, retrying adapter."""
+        adapter = client.session.get_adapter("https://server/piwebapi")
+        assert client.session.get_adapter("http://server/piwebapi") is adapter
+        assert adapter._pool_maxsize == 32
+        assert adapter.max_retries.total == 3
+        assert adapter.max_retries.raise_on_status is False
+
+    def test_pool_size_from_config(self):
+        """Test that pool size and retries follow the configuration."""
+        client = PIWebAPIClient(
+            PIWebAPIConfig(base_url="https://server", pool_maxsize=4, max_retries=0)
+        )
+        adapter = client.session.get_adapter("https://server")
+        assert adapter._pool_maxsize == 4
+        assert adapter.max_retries.total == 0
+
+
+class TestQueryEncoding:
+    """Test pre-encoded query strings."""
+
+    def test_matches_requests_encoding(self):
+        """Test that the encoded query decodes to what requests would send."""
+        params = {
+            "webId": ["W1", "W/2"],
+            "startTime": "2024-01-01T00:00:00+02:00",
+            "filterExpression": "'.' > 5 AND '.' < 10",
+            "maxCount": 100,
+            "includeFilteredValues": True,
+            "desiredUnits": None,
+            "nameFilter": "Température*",
+        }
+        expected = requests.Request("GET", "https://server/", params=params).prepare().url
+        assert parse_qsl(_encode_query(params)) == parse_qsl(urlsplit(expected).query)
+
+    def test_non_list_iterables_repeat_key(self):
+        """Test that any non-string iterable is expanded like requests does."""
+        params = {
+            "webId": (w for w in ["W1", "W2"]),
+            "summaryType": {"Average"},
+            "nameFilter": b"Pump*",
+        }
+        expected = requests.Request(
+            "GET",
+            "https://server/",
+            params={"webId": ["W1", "W2"], "summaryType": {"Average"}, "nameFilter": b"Pump*"},
+        ).prepare().url
+        assert parse_qsl(_encode_query(params)) == parse_qsl(urlsplit(expected).query)
+
+    def test_all_none_params(self, client):
+        """Test that only webIdType is sent when every param value is None."""
+        client.session.request.return_value = _response(content=b"{}")
+        client.get("points", params={"nameFilter": None, "maxCount": None})
+        assert client.session.request.call_args.kwargs["params"] == "webIdType=Full"
+
+    def test_default_web_id_type_appended(self, client):
+        """Test that webIdType is added without mutating the caller's params."""
+        client.session.request.return_value = _response(content=b"{}")
+        params = {"selectedFields": "Items.Value;Items.Timestamp"}
+        client.get("streams/W1/value", params=params)
+        query = client.session.request.call_args.kwargs["params"]
+        assert query == "selectedFields=Items.Value%3BItems.Timestamp&webIdType=Full"
+        assert params == {"selectedFields": "Items.Value;Items.Timestamp"}
+
+    def test_explicit_web_id_type_kept(self, client):
+        """Test that a caller-provided webIdType is not duplicated."""
+        client.session.request.return_value = _response(content=b"{}")
+        client.get("points", params={"webIdType": "IDOnly"})
+        assert client.session.request.call_args.kwargs["params"] == "webIdType=IDOnly"
+
+
+class TestAsyncOmf:
+    """Test OMF messages sent on an async session."""
+
+    def test_send_time_series_data_async(self, client):
+        """Test that OMF headers, params and body reach the async session."""
+        httpx = pytest.importorskip("httpx")
+        from pi_web_sdk.controllers.omf import OMFManager
+        from pi_web_sdk.models.omf import OMFTimeSeriesData
+
+        requests_seen = []
+
+        def handler(request):
+            requests_seen.append(request)
+            return httpx.Response(202)
+
+        manager = OMFManager(client, data_server_web_id="DS1")
+        ts_data = OMFTimeSeriesData(
+            container_id="C1", values=[{"timestamp": "2024-01-01T00:00:00Z", "value": 1.5}]
+        )
+
+        async def send():
+            async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as session:
+                return await manager.send_time_series_data_async(session, ts_data)
+
+        assert asyncio.run(send()) == {"content": ""}
+        (request,) = requests_seen
+        assert request.url.path == "/piwebapi/omf"
+        assert request.url.params["dataServerWebId"] == "DS1"
+        assert request.headers["messagetype"] == "Data"
+        assert request.headers["action"] == "create"
+        assert json.loads(request.content) == [ts_data.to_dict()]
+
+    def test_gzip_compression(self, client):
+        """Test that compressed messages carry the OMF compression header."""
+        from pi_web_sdk.controllers.omf import OMFManager
+        from pi_web_sdk.models.omf import OMFTimeSeriesData
+
+        client.session.request.return_value = _response(status_code=202)
+        manager = OMFManager(client, data_server_web_id="DS1", compression="gzip")
+        manager.send_time_series_data(OMFTimeSeriesData(container_id="C1", values=[]))
+        kwargs = client.session.request.call_args.kwargs
+        assert kwargs["headers"]["compression"] == "gzip"
+        assert json.loads(gzip.decompress(kwargs["data"])) == [{"containerid": "C1", "values": []}]
+
+    def test_streamed_gzip_body(self, client):
+        """Test that chunked bodies are streamed gzip-compressed to the async session."""
+        httpx = pytest.importorskip("httpx")
+        from pi_web_sdk.controllers.omf import OMFManager
+        from pi_web_sdk.models.omf import OMFTimeSeriesData
+
+        requests_seen = []
+
+        def handler(request):
+            requests_seen.append(request)
+            return httpx.Response(202)
+
+        manager = OMFManager(client, data_server_web_id="DS1", compression="gzip", chunk_size=2)
+        ts_data = OMFTimeSeriesData(container_id="C1", values=[{"value": i} for i in range(5)])
+
+        async def send():
+            async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as session:
+                return await manager.send_time_series_data_async(session, ts_data)
+
+        asyncio.run(send())
+        (request,) = requests_seen
+        assert request.headers["transfer-encoding"] == "chunked"
+        assert request.headers["compression"] == "gzip"
+        assert json.loads(gzip.decompress(request.content)) == [ts_data.to_dict()]
+
+    def test_unsupported_compression(self, client):
+        """Test that unknown compression schemes are rejected."""
+        with pytest.raises(ValueError):
+            client.omf.post_async(data=[], compression="zstd")
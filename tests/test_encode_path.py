@@ -0,0 +1,38 @@
+"""Tests for BaseController path encoding."""
+
+from __future__ import annotations
+
+import urllib.parse
+from unittest.mock import MagicMock
+
+import pytest
+
+from pi_web_sdk.controllers import base
+from pi_web_sdk.controllers.base import BaseController
+
+PATHS = [
+    "",
+    "F1EmAbcDEFghIJ-_klm",
+    "\\\\server\\database\\element|attribute",
+    "path with spaces/and?query=chars&more",
+    "ünïcødé 日本 ~._-",
+]
+
+ENCODERS = [pytest.param(base._py_encode_path, id="python")]
+if base._cy_encode_path is not None:
+    ENCODERS.append(pytest.param(base._cy_encode_path, id="cython"))
+
+
+class TestEncodePath:
+    """Test path encoding implementations."""
+
+    @pytest.mark.parametrize("encode", ENCODERS)
+    @pytest.mark.parametrize("path", PATHS)
+    def test_matches_urllib_quote(self, encode, path):
+        """Test that every implementation matches urllib.parse.quote(safe='')."""
+        assert encode(path) == urllib.parse.quote(path, safe="")
+
+    def test_controller_uses_selected_implementation(self):
+        """Test that BaseController delegates to the module-level encoder."""
+        controller = BaseController(MagicMock())
+        assert controller._encode_path("a b\\c") == "a%20b%5Cc"
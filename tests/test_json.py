@@ -0,0 +1,92 @@
+"""Tests for the JSON helpers."""
+
+from __future__ import annotations
+
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from pi_web_sdk import _json
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def backend(request, monkeypatch):
+    """Run a test with orjson (when installed) and with the stdlib fallback."""
+    if request.param == "orjson":
+        if _json.orjson is None:
+            pytest.skip("orjson not installed")
+    else:
+        monkeypatch.setattr(_json, "orjson", None)
+    return request.param
+
+
+class TestDumps:
+    """Test dumps() on both backends."""
+
+    def test_compact_output(self, backend):
+        """Test that output is compact UTF-8 JSON bytes."""
+        assert _json.dumps({"Name": "Température", "Value": [1, 2.5]}) == (
+            '{"Name":"Température","Value":[1,2.5]}'.encode("utf-8")
+        )
+
+    def test_datetimes(self, backend):
+        """Test that UTC datetimes get a Z suffix and other offsets are kept."""
+        payload = [
+            datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+            datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone(timedelta(hours=2))),
+        ]
+        assert json.loads(_json.dumps(payload)) == [
+            "2024-01-02T03:04:05Z",
+            "2024-01-02T03:04:05+02:00",
+        ]
+
+    def test_numpy_values(self, backend):
+        """Test that NumPy arrays and scalars serialize as plain numbers."""
+        np = pytest.importorskip("numpy")
+        payload = {"values": np.array([1.5, 2.0]), "count": np.int64(2)}
+        assert json.loads(_json.dumps(payload)) == {"values": [1.5, 2.0], "count": 2}
+
+    def test_loads_round_trip(self, backend):
+        """Test that loads() reverses dumps()."""
+        payload = {"Items": [{"WebId": "W1", "Value": 1.5}]}
+        assert _json.loads(_json.dumps(payload)) == payload
+
+    def test_numpy_structured_array(self, backend):
+        """Test that structured arrays serialize as one object per record."""
+        np = pytest.importorskip("numpy")
+        records = np.array(
+            [("2024-01-01T00:00:00Z", 1.5), ("2024-01-01T00:00:10Z", 2.25)],
+            dtype=[("timestamp", "U20"), ("value", "f8")],
+        )
+        assert json.loads(_json.dumps({"values": records[1:]})) == {
+            "values": [{"timestamp": "2024-01-01T00:00:10Z", "value": 2.25}]
+        }
+
+
+class TestIterDumps:
+    """Test chunked serialization with iter_dumps()."""
+
+    def test_matches_dumps(self, backend):
+        """Test that the joined pieces equal dumps() output."""
+        payload = [
+            {"containerid": "C1", "values": [{"value": i} for i in range(10)]},
+            {"containerid": "C2", "values": []},
+        ]
+        pieces = list(_json.iter_dumps(payload, chunk_size=3))
+        assert b"".join(pieces) == _json.dumps(payload)
+        assert len(pieces) > 4
+
+    def test_short_values_encoded_whole(self, backend):
+        """Test that payloads without long lists are a single piece."""
+        payload = {"Items": [1, 2, 3]}
+        assert list(_json.iter_dumps(payload, chunk_size=3)) == [_json.dumps(payload)]
+
+    def test_numpy_structured_array(self, backend):
+        """Test that structured arrays are chunked by record."""
+        np = pytest.importorskip("numpy")
+        records = np.zeros(5, dtype=[("timestamp", "U20"), ("value", "i2")])
+        payload = [{"containerid": "C1", "values": records}]
+        pieces = list(_json.iter_dumps(payload, chunk_size=2))
+        assert b"".join(pieces) == _json.dumps(payload)
+        assert json.loads(b"".join(pieces))[0]["values"][4] == {"timestamp": "", "value": 0}
@@ -0,0 +1,123 @@
+"""Tests for PI Web API model serialization."""
+
+from __future__ import annotations
+
+import dataclasses
+import sys
+from datetime import datetime, timezone
+
+import pytest
+
+from pi_web_sdk.models import Element, EventFrame, EventFrameCategory, PIWebAPIObject
+
+
+class TestToDict:
+    """Test generated to_dict methods."""
+
+    def test_base_fields(self):
+        """Test that base fields map to PI Web API names."""
+        obj = PIWebAPIObject(web_id="W1", name="Obj")
+        assert obj.to_dict() == {"WebId": "W1", "Name": "Obj"}
+
+    def test_exclude_none_false_keeps_all_fields(self):
+        """Test that every field is emitted when exclude_none is False."""
+        result = EventFrameCategory(name="Cat").to_dict(exclude_none=False)
+        assert list(result) == [
+            "WebId", "Id", "Name", "Description", "Path", "Links", "SecurityDescriptor",
+        ]
+        assert result["Name"] == "Cat"
+        assert result["SecurityDescriptor"] is None
+
+    def test_event_frame_formats_times(self):
+        """Test that event frame time fields are formatted."""
+        frame = EventFrame(
+            name="Batch 1",
+            start_time=datetime(2024, 1, 1, 8, 0, tzinfo=timezone.utc),
+            end_time="*",
+            severity="Major",
+        )
+        assert frame.to_dict() == {
+            "Name": "Batch 1",
+            "EndTime": "*",
+            "Severity": "Major",
+            "StartTime": "2024-01-01T08:00:00Z",
+        }
+
+    def test_subclass_fields_follow_base_fields(self):
+        """Test that subclass fields are serialized after base fields."""
+        element = Element(web_id="E1", template_name="Pump", has_children=False)
+        assert list(element.to_dict()) == ["WebId", "TemplateName", "HasChildren"]
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots require Python 3.10+")
+class TestSlots:
+    """Test slotted event frame models."""
+
+    @pytest.mark.parametrize("cls", [PIWebAPIObject, EventFrame, EventFrameCategory])
+    def test_no_instance_dict(self, cls):
+        """Test that slotted models do not carry a __dict__."""
+        assert not hasattr(cls(name="x"), "__dict__")
+
+    def test_unknown_attribute_rejected(self):
+        """Test that attributes outside the declared fields cannot be set."""
+        frame = EventFrame(name="x")
+        with pytest.raises(AttributeError):
+            frame.unknown = 1
+
+
+class TestEventFrameFromList:
+    """Test bulk event frame construction."""
+
+    def test_field_table_matches_dataclass_order(self):
+        """Test that _FIELDS lists fields in dataclass order (required by from_list)."""
+        assert [f[0] for f in EventFrame._FIELDS] == [
+            f.name for f in dataclasses.fields(EventFrame)
+        ]
+
+    def test_complete_and_partial_items(self):
+        """Test that complete items and items with missing keys both parse."""
+        complete = {api_name: f"value-{i}" for i, (_, api_name, *_) in enumerate(EventFrame._FIELDS)}
+        partial = {"WebId": "F1", "Name": "Partial", "Severity": "Minor"}
+
+        frames = EventFrame.from_list([complete, partial])
+
+        assert frames == [EventFrame.from_dict(complete), EventFrame.from_dict(partial)]
+        assert frames[1].severity == "Minor"
+        assert frames[1].start_time is None
+
+    def test_partial_items(self):
+        """Test that batches of partial items (e.g. selectedFields) match from_dict()."""
+        items = [{"WebId": f"F{i}", "Name": f"Frame{i}", "StartTime": "*-1h"} for i in range(3)]
+        assert EventFrame.from_list(items) == [EventFrame.from_dict(item) for item in items]
+
+    def test_partial_item_after_complete_ones(self):
+        """Test that a partial item later in a complete batch still parses."""
+        complete = {api_name: f"value-{i}" for i, (_, api_name, *_) in enumerate(EventFrame._FIELDS)}
+        items = [complete, complete, {"Name": "Partial"}]
+        assert EventFrame.from_list(items) == [EventFrame.from_dict(item) for item in items]
+
+    def test_empty(self):
+        """Test that an empty batch returns an empty list."""
+        assert EventFrame.from_list([]) == []
+
+
+class TestFromDict:
+    """Test from_dict parsing."""
+
+    def test_parse_base(self):
+        """Test that _parse_base maps the base API fields to kwargs."""
+        data = {"WebId": "W1", "Id": "I1", "Name": "N", "Links": {"Self": "u"}}
+        assert PIWebAPIObject._parse_base(data) == {
+            "web_id": "W1",
+            "id": "I1",
+            "name": "N",
+            "description": None,
+            "path": None,
+            "links": {"Self": "u"},
+        }
+
+    @pytest.mark.parametrize("cls", [Element, EventFrame, EventFrameCategory])
+    def test_round_trip(self, cls):
+        """Test that from_dict reads back every field written by to_dict."""
+        data = {api_name: f"value-{i}" for i, (_, api_name, *_) in enumerate(cls._FIELDS)}
+        assert cls.from_dict(data).to_dict() == data
@@ -0,0 +1,88 @@
+"""Tests for helpers in the OMF sandbox script."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+pytest.importorskip("numpy")
+
+import sandbox_omf  # noqa: E402
+from pi_web_sdk.client import PIWebAPIClient  # noqa: E402
+from pi_web_sdk.config import AuthMethod, PIWebAPIConfig, WebIDType  # noqa: E402
+from pi_web_sdk.exceptions import PIWebAPIError  # noqa: E402
+
+
+@pytest.fixture
+def client():
+    """Create a client whose batch controller is mocked."""
+    client = PIWebAPIClient(
+        PIWebAPIConfig(
+            base_url="https://server/piwebapi",
+            auth_method=AuthMethod.ANONYMOUS,
+            webid_type=WebIDType.ID_ONLY,
+        )
+    )
+    client.batch = MagicMock()
+    return client
+
+
+class TestCreateHierarchyBatch:
+    """Test batch creation of the sandbox element hierarchy."""
+
+    def test_sub_requests_use_configured_webid_type(self, client):
+        """Test that every sub-request asks for the client's WebID format."""
+        batches = []
+
+        def execute(requests):
+            batches.append(requests)
+            if len(batches) == 1:
+                return {name: {"Status": 404} for name in requests}
+            return {
+                name: {"Status": 200, "Content": {"WebId": f"I1{name}"}}
+                for name in requests
+                if name.startswith("get")
+            }
+
+        client.batch.execute.side_effect = execute
+
+        elements = sandbox_omf.create_hierarchy_batch(client, "D1", "\\\\AF\\DB")
+
+        resources = [request["Resource"] for batch in batches for request in batch.values()]
+        assert len(resources) == 3 * len(sandbox_omf.HIERARCHY)
+        assert all(resource.endswith("webIdType=IDOnly") for resource in resources)
+        assert "{0}?webIdType=IDOnly" in resources
+        assert "{0}/elements?webIdType=IDOnly" in resources
+        assert elements["IndyIQ"]["WebId"] == "I1get0"
+
+
+class TestSendBatchesConcurrently:
+    """Test concurrent OMF batch sending."""
+
+    def test_batches_stay_ordered_and_stop_on_failure(self):
+        """Test that each container sends in order and stops at its first failure."""
+        manager = MagicMock()
+        manager.client.async_session.side_effect = PIWebAPIError("httpx not installed")
+        sent = []
+
+        def send(batch):
+            sent.append(batch)
+            if batch == "a2":
+                raise PIWebAPIError("rejected")
+            return batch
+
+        manager.send_time_series_data.side_effect = send
+
+        results = asyncio.run(
+            sandbox_omf.send_batches_concurrently(manager, [["a1", "a2", "a3"], ["b1", "b2"]])
+        )
+
+        assert results[0][0] == "a1"
+        assert isinstance(results[0][1], PIWebAPIError)
+        assert len(results[0]) == 2
+        assert results[1] == ["b1", "b2"]
+        assert "a3" not in sent
+        assert sent.index("a1") < sent.index("a2")
+        assert sent.index("b1") < sent.index("b2")
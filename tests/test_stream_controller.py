@@ -0,0 +1,261 @@
+"""Tests for StreamController and StreamSetController query parameters."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+import pytest
+
+from pi_web_sdk.client import PIWebAPIClient
+from pi_web_sdk.config import AuthMethod, PIWebAPIConfig
+from pi_web_sdk.controllers.base import _format_time, _make_param_builder
+from pi_web_sdk.controllers.stream import (
+    StreamController,
+    StreamSetController,
+    encode_stream_values,
+)
+
+
+@pytest.fixture
+def mock_client():
+    """Create a mock PI Web API client."""
+    client = MagicMock()
+    client.get.return_value = {"Items": []}
+    return client
+
+
+class TestFormatTime:
+    """Test time formatting for query parameters."""
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            datetime(2024, 5, 6, 7, 8, 9),
+            datetime(999, 1, 1),
+            datetime(2024, 5, 6, 7, 8, 9, 123456),
+            datetime(2024, 5, 6, 7, 8, 9, tzinfo=timezone(timedelta(hours=2))),
+        ],
+    )
+    def test_matches_isoformat(self, value):
+        """Test that datetimes without a UTC offset match isoformat()."""
+        assert _format_time(value) == value.isoformat()
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            datetime(2024, 5, 6, 7, 8, 9, tzinfo=timezone.utc),
+            datetime(5, 1, 1, tzinfo=timezone.utc),
+            datetime(2024, 5, 6, 7, 8, 9, 500, tzinfo=timezone.utc),
+            datetime(2024, 5, 6, 7, 8, 9, tzinfo=timezone(timedelta(0))),
+        ],
+    )
+    def test_utc_uses_z_suffix(self, value):
+        """Test that UTC datetimes match isoformat() with a Z suffix."""
+        assert _format_time(value) == value.isoformat().replace("+00:00", "Z")
+
+    def test_strings_and_none_pass_through(self):
+        """Test that strings and None are returned unchanged."""
+        assert _format_time("*-1d") == "*-1d"
+        assert _format_time(None) is None
+
+    def test_rejects_other_types(self):
+        """Test that unsupported types raise TypeError."""
+        with pytest.raises(TypeError):
+            _format_time(1700000000)
+
+
+class TestMakeParamBuilder:
+    """Test the generated query parameter builders."""
+
+    def test_includes_only_truthy_values(self):
+        """Test that falsy optional values are omitted."""
+        build = _make_param_builder(
+            (("name_filter", "nameFilter", None), ("max_count", "maxCount", None))
+        )
+        assert build(name_filter="Pump*", max_count=0) == {"nameFilter": "Pump*"}
+        assert build(name_filter=None, max_count=None) == {}
+
+    def test_required_values_always_included(self):
+        """Test that required parameters are always present."""
+        build = _make_param_builder(
+            (("selected_fields", "selectedFields", None),),
+            required=(("web_ids", "webId"),),
+        )
+        assert build(web_ids=[], selected_fields=None) == {"webId": []}
+
+    def test_formatter_applied(self):
+        """Test that formatters run on non-None values only."""
+        build = _make_param_builder((("start_time", "startTime", _format_time),))
+        start = datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+        assert build(start_time=start) == {"startTime": "2024-01-02T03:04:05Z"}
+        assert build(start_time=None) == {}
+
+    def test_rejects_invalid_names(self):
+        """Test that non-identifier kwargs are rejected."""
+        with pytest.raises(ValueError):
+            _make_param_builder((("bad-name", "badName", None),))
+
+
+class TestStreamControllerParams:
+    """Test StreamController query parameters."""
+
+    def test_get_value(self, mock_client):
+        """Test get_value with all parameters."""
+        controller = StreamController(mock_client)
+        controller.get_value("W1", selected_fields="Value", time="*-1h", desired_units="degC")
+        mock_client.get.assert_called_once_with(
+            "streams/W1/value",
+            params={"selectedFields": "Value", "time": "*-1h", "desiredUnits": "degC"},
+        )
+
+    def test_get_end(self, mock_client):
+        """Test get_end requests the stream's end value."""
+        controller = StreamController(mock_client)
+        controller.get_end("W1", selected_fields="Timestamp;Value")
+        mock_client.get.assert_called_once_with(
+            "streams/W1/end", params={"selectedFields": "Timestamp;Value"}
+        )
+
+    def test_get_recorded(self, mock_client):
+        """Test get_recorded formats times and skips unset values."""
+        controller = StreamController(mock_client)
+        controller.get_recorded(
+            "W1",
+            start_time=datetime(2024, 1, 1, tzinfo=timezone.utc),
+            end_time="*",
+            max_count=100,
+        )
+        mock_client.get.assert_called_once_with(
+            "streams/W1/recorded",
+            params={
+                "includeFilteredValues": False,
+                "startTime": "2024-01-01T00:00:00Z",
+                "endTime": "*",
+                "maxCount": 100,
+            },
+        )
+
+    def test_get_interpolated(self, mock_client):
+        """Test get_interpolated with sync time."""
+        controller = StreamController(mock_client)
+        controller.get_interpolated(
+            "W1", start_time="*-1d", interval="1h", sync_time="t", sync_time_boundary_type="Inside"
+        )
+        mock_client.get.assert_called_once_with(
+            "streams/W1/interpolated",
+            params={
+                "includeFilteredValues": False,
+                "startTime": "*-1d",
+                "interval": "1h",
+                "syncTime": "t",
+                "syncTimeBoundaryType": "Inside",
+            },
+        )
+
+    def test_get_summary(self, mock_client):
+        """Test get_summary passes summary types through."""
+        controller = StreamController(mock_client)
+        controller.get_summary("W1", summary_type=["Average", "Maximum"])
+        mock_client.get.assert_called_once_with(
+            "streams/W1/summary", params={"summaryType": ["Average", "Maximum"]}
+        )
+
+    def test_invalid_time_type(self, mock_client):
+        """Test that unsupported time types raise TypeError."""
+        controller = StreamController(mock_client)
+        with pytest.raises(TypeError):
+            controller.get_plot("W1", start_time=12345)
+
+
+class TestStreamSetControllerParams:
+    """Test StreamSetController query parameters."""
+
+    def test_get_values(self, mock_client):
+        """Test get_values includes the WebIDs."""
+        controller = StreamSetController(mock_client)
+        controller.get_values(["W1", "W2"], time="*")
+        mock_client.get.assert_called_once_with(
+            "streamsets/value", params={"webId": ["W1", "W2"], "time": "*"}
+        )
+
+    def test_get_recorded(self, mock_client):
+        """Test get_recorded includes WebIDs and filter flag."""
+        controller = StreamSetController(mock_client)
+        controller.get_recorded(["W1"], include_filtered_values=True, boundary_type="Inside")
+        mock_client.get.assert_called_once_with(
+            "streamsets/recorded",
+            params={
+                "webId": ["W1"],
+                "includeFilteredValues": True,
+                "boundaryType": "Inside",
+            },
+        )
+
+    def test_get_plot(self, mock_client):
+        """Test get_plot with intervals."""
+        controller = StreamSetController(mock_client)
+        controller.get_plot(["W1"], intervals=24, time_zone="UTC")
+        mock_client.get.assert_called_once_with(
+            "streamsets/plot",
+            params={"webId": ["W1"], "intervals": 24, "timeZone": "UTC"},
+        )
+
+
+class TestStreamSetUpdateValues:
+    """Test bulk value updates for stream sets."""
+
+    def test_update_values_sends_serialized_body(self, mock_client):
+        """Test that update_values serializes the updates once."""
+        controller = StreamSetController(mock_client)
+        updates = [{"WebId": "W1", "Value": {"Value": 1.5}}]
+        controller.update_values(updates)
+        mock_client.put.assert_called_once()
+        args, kwargs = mock_client.put.call_args
+        assert args == ("streamsets/value",)
+        assert json.loads(kwargs["body"]) == updates
+
+    def test_update_values_raw(self, mock_client):
+        """Test that update_values_raw passes the payload through unchanged."""
+        controller = StreamSetController(mock_client)
+        controller.update_values_raw(b"[]")
+        mock_client.put.assert_called_once_with("streamsets/value", body=b"[]")
+
+    def test_encode_stream_values(self):
+        """Test payload encoding with and without timestamps."""
+        stamp = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        payload = encode_stream_values(["W1", "W2"], [1, 2.5], [stamp, "*"])
+        assert json.loads(payload) == [
+            {"WebId": "W1", "Value": {"Timestamp": "2024-01-01T00:00:00Z", "Value": 1}},
+            {"WebId": "W2", "Value": {"Timestamp": "*", "Value": 2.5}},
+        ]
+        assert json.loads(encode_stream_values(["W1"], [3])) == [
+            {"WebId": "W1", "Value": {"Value": 3}}
+        ]
+
+
+class TestStreamSetGetValuesAsync:
+    """Test concurrent stream set value retrieval."""
+
+    def test_chunks_and_merges_items(self):
+        """Test that WebIDs are split across requests and Items merged in order."""
+        httpx = pytest.importorskip("httpx")
+        requested = []
+
+        def handler(request):
+            web_ids = request.url.params.get_list("webId")
+            requested.append(web_ids)
+            return httpx.Response(200, json={"Items": [{"WebId": w} for w in web_ids]})
+
+        client = PIWebAPIClient(
+            PIWebAPIConfig(base_url="https://server/piwebapi", auth_method=AuthMethod.ANONYMOUS)
+        )
+        client.async_session = lambda: httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        web_ids = [f"W{i}" for i in range(5)]
+
+        result = asyncio.run(client.streamset.get_values_async(web_ids, chunks=2))
+
+        assert sorted(requested) == [["W0", "W1", "W2"], ["W3", "W4"]]
+        assert [item["WebId"] for item in result["Items"]] == web_ids